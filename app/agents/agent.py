@@ -1,26 +1,44 @@
-from functools import lru_cache
-from langchain_community.chat_models import ChatOpenAI
+from functools import lru_cache, partial
+from typing import Optional, Tuple
+
 from langchain.agents import initialize_agent
-from langchain.memory import ConversationBufferMemory
+from langchain.memory import ConversationBufferWindowMemory
 
-from app.core.config import OPENAI_MODEL, OPENAI_TEMPERATURE, OPENAI_MAX_TOKENS, OPENAI_TIMEOUT
+from app.core.config import RESTAURANT_NAME, CHAT_MEMORY_TURNS
+from app.agents.llm import get_llm
+from app.agents.sessions import ChatSession, chat_sessions
 from app.agents.tools import get_tools
 
-@lru_cache(maxsize=1)
-def get_agent():
-    llm = ChatOpenAI(
-        model_name=OPENAI_MODEL,
-        temperature=OPENAI_TEMPERATURE,
-        max_tokens=OPENAI_MAX_TOKENS,
-        request_timeout=OPENAI_TIMEOUT,
+# Each restaurant's tools are stateless, so every session shares them (as it does get_llm())
+@lru_cache(maxsize=128)
+def _get_tools(restaurant: str):
+    return get_tools(restaurant)
+
+def create_memory() -> ConversationBufferWindowMemory:
+    # Only the last CHAT_MEMORY_TURNS exchanges go into the prompt
+    return ConversationBufferWindowMemory(
+        k=CHAT_MEMORY_TURNS, memory_key="chat_history", return_messages=True
     )
-    tools = get_tools()
-    memory = ConversationBufferMemory(memory_key="chat_history", return_messages=True)
-    agent = initialize_agent(
-        tools,
-        llm,
+
+def create_agent(
+    restaurant: str = RESTAURANT_NAME, memory: Optional[ConversationBufferWindowMemory] = None
+):
+    return initialize_agent(
+        _get_tools(restaurant),
+        get_llm(),
         agent="conversational-react-description",
-        memory=memory,
+        memory=memory if memory is not None else create_memory(),
         verbose=True,
     )
-    return agent
+
+def get_agent(
+    session_id: Optional[str] = None, restaurant: str = RESTAURANT_NAME
+) -> Tuple[str, ChatSession]:
+    """Return (session_id, session) for a conversation, starting one if needed.
+
+    A new session only gets its memory; its agent is built on first use.
+    """
+    return chat_sessions.get_or_create(restaurant, session_id, _create_session)
+
+def _create_session(restaurant: str) -> ChatSession:
+    return ChatSession(memory=create_memory(), build_agent=partial(create_agent, restaurant))
@@ -0,0 +1,197 @@
+"""
+Deterministic fast path in front of the chat agent.
+
+Fully specified requests such as "cancel booking ABC1234 reason 1" or
+"availability 2025-08-15 for 4" are recognised with regular expressions and
+the shared normalisers, then dispatched straight to the matching tool with
+no LLM round trip. Anything ambiguous or missing a slot returns no intent
+and goes to the agent, which can ask follow-up questions.
+
+Author: AI Assistant
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.agents.tools import (
+    cancel_booking_tool,
+    check_availability_tool,
+    create_booking_tool,
+    get_booking_tool,
+)
+from app.utils.nlp import TIME_AMPM_RE, normalize_date, normalize_party_size, normalize_time
+
+# References are seven upper-case letters and digits. The token is matched in
+# its original casing and must contain a digit, so words such as "details" or
+# "tonight" after "booking" are never taken for a reference
+REFERENCE_RE = re.compile(
+    r"\b(?i:booking|reservation|reference|ref)\s*(?i:reference|ref|number|no\.?)?\s*[:#]?\s*"
+    r"((?=[A-Z]*\d)[A-Z0-9]{7})\b"
+)
+REASON_RE = re.compile(r"\breason\s*(?:id)?\s*[:#]?\s*(\d{1,2})\b", re.IGNORECASE)
+DATE_ISO_IN_TEXT_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
+DATE_PHRASE_RE = re.compile(
+    r"\b(?:today|tomorrow|(?:this\s+|next\s+)?weekend|"
+    r"(?:this|next)\s+(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday))\b",
+    re.IGNORECASE,
+)
+TIME_24H_RE = re.compile(r"\b(?:[01]?\d|2[0-3]):[0-5]\d(?::[0-5]\d)?\b")
+
+CANCEL_RE = re.compile(r"\bcancel\b", re.IGNORECASE)
+CHANGE_RE = re.compile(r"\b(?:change|update|modify|move|reschedule|amend)\b", re.IGNORECASE)
+LOOKUP_RE = re.compile(
+    r"\b(?:show|view|check|see|look|find|details?|status|get|what|when)\b", re.IGNORECASE
+)
+BOOK_RE = re.compile(r"\b(?:book|reserve)\b", re.IGNORECASE)
+AVAILABILITY_RE = re.compile(r"\b(?:availab\w*|free|open|slots?|tables?)\b", re.IGNORECASE)
+# Negations and alternatives are left to the LLM
+HEDGE_RE = re.compile(r"\b(?:not|don'?t|never|instead|or|but)\b", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Intent:
+    """
+    A request the fast path can answer without the LLM.
+
+    Attributes:
+        name: Intent name used in metrics
+        tool: Tool function answering the request
+        tool_input: Input string in the tool's 'Key: Value, ...' format
+    """
+
+    name: str
+    tool: Callable[..., str]
+    tool_input: str
+
+
+def _find_date(text: str) -> Tuple[Optional[str], Optional[str], str]:
+    """Return (phrase, ISO date, text without the match) for an explicit date."""
+    for pattern in (DATE_ISO_IN_TEXT_RE, DATE_PHRASE_RE):
+        m = pattern.search(text)
+        if m:
+            phrase = m.group(0)
+            return phrase, normalize_date(phrase, phrase), text[:m.start()] + text[m.end():]
+    return None, None, text
+
+
+def _find_time(text: str) -> Tuple[Optional[str], str]:
+    """Return (HH:MM:SS, text without the match) for an explicit time."""
+    m = TIME_AMPM_RE.search(text)
+    if m:
+        return normalize_time(None, m.group(0)), text[:m.start()] + text[m.end():]
+    m = TIME_24H_RE.search(text)
+    if m:
+        return normalize_time(m.group(0), m.group(0)), text[:m.start()] + text[m.end():]
+    return None, text
+
+
+def match_intent(message: str) -> Optional[Intent]:
+    """
+    Classify a chat message when every slot its tool needs is present.
+
+    Args:
+        message: The user's chat message
+
+    Returns:
+        Optional[Intent]: The intent to dispatch, or None to use the agent
+    """
+    text = message.strip()
+    if not text or HEDGE_RE.search(text):
+        return None
+
+    ref_match = REFERENCE_RE.search(text)
+    if ref_match:
+        ref = ref_match.group(1)
+        if CHANGE_RE.search(text) or BOOK_RE.search(text):
+            return None
+        if CANCEL_RE.search(text):
+            reason = REASON_RE.search(text)
+            if not reason:
+                return None
+            return Intent(
+                "cancel_booking", cancel_booking_tool,
+                f"Booking_Reference: {ref}, CancellationReasonId: {reason.group(1)}"
+            )
+        if LOOKUP_RE.search(text):
+            return Intent("get_booking", get_booking_tool, f"Booking_Reference: {ref}")
+        return None
+
+    if CANCEL_RE.search(text) or CHANGE_RE.search(text):
+        return None
+
+    phrase, visit_date, rest = _find_date(text)
+    if not visit_date:
+        return None
+    visit_time, rest = _find_time(rest)
+    # Party size is read after removing the date and time so '19:00' is not a party of 19
+    party = normalize_party_size(None, rest)
+    if not party:
+        return None
+
+    if BOOK_RE.search(text):
+        if not visit_time or "weekend" in phrase.lower():
+            return None
+        return Intent(
+            "create_booking", create_booking_tool,
+            f"VisitDate: {visit_date}, VisitTime: {visit_time}, PartySize: {party}, "
+            "ChannelCode: ONLINE"
+        )
+    if AVAILABILITY_RE.search(text) and not visit_time:
+        # Weekends are passed as the phrase so the tool searches both days
+        date_input = "this weekend" if "weekend" in phrase.lower() else visit_date
+        return Intent(
+            "check_availability", check_availability_tool,
+            f"VisitDate: {date_input}, PartySize: {party}, ChannelCode: ONLINE"
+        )
+    return None
+
+
+class IntentMetrics:
+    """
+    Thread-safe fast-path hit rate and latency counters.
+
+    Latency saved is estimated as fast-path hits times the difference between
+    the mean agent turn and the mean fast-path answer.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self._fast_seconds = 0.0
+        self._agent_turns = 0
+        self._agent_seconds = 0.0
+
+    def record_fast_path(self, intent: str, seconds: float) -> None:
+        """Record a message answered by the fast path."""
+        with self._lock:
+            self._hits[intent] = self._hits.get(intent, 0) + 1
+            self._fast_seconds += seconds
+
+    def record_agent(self, seconds: float) -> None:
+        """Record a message answered by the LLM agent."""
+        with self._lock:
+            self._agent_turns += 1
+            self._agent_seconds += seconds
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit rate, mean latencies and estimated time saved."""
+        with self._lock:
+            hits = sum(self._hits.values())
+            total = hits + self._agent_turns
+            fast_mean = self._fast_seconds / hits if hits else 0.0
+            agent_mean = self._agent_seconds / self._agent_turns if self._agent_turns else 0.0
+            return {
+                "fast_path_hits": dict(self._hits),
+                "agent_turns": self._agent_turns,
+                "hit_rate": round(hits / total, 4) if total else 0.0,
+                "fast_path_mean_ms": round(fast_mean * 1000, 2),
+                "agent_mean_ms": round(agent_mean * 1000, 2),
+                "estimated_seconds_saved": (
+                    round(hits * max(agent_mean - fast_mean, 0.0), 3) if self._agent_turns else None
+                ),
+            }
+
+
+intent_metrics = IntentMetrics()
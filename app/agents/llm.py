@@ -0,0 +1,205 @@
+"""
+Chat model construction and LLM response caching.
+
+Repeated questions ("what's free this weekend for 2") produce the same
+prompt for a fresh conversation, so model responses are cached on the
+whitespace-normalised prompt together with the model settings (model name,
+temperature, ...). The prompt does not carry today's date, while a cached
+step may have turned "tomorrow" into a concrete one, so keys are scoped to
+the local day. The backend is pluggable: an in-memory LRU, an on-disk
+SQLite database shared across restarts (bounded, and pruned of earlier
+days), or none.
+
+LLM_PROVIDER=stub swaps OpenAI for a deterministic local model so agent
+behaviour and cache hit rates can be checked offline without an API key.
+
+Author: AI Assistant
+"""
+
+import asyncio
+import re
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+from langchain_community.cache import SQLiteCache
+from langchain_community.chat_models import ChatOpenAI
+from langchain_core.caches import BaseCache, InMemoryCache
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from sqlalchemy import text
+
+from app.core.config import (
+    OPENAI_MODEL, OPENAI_TEMPERATURE, OPENAI_MAX_TOKENS, OPENAI_TIMEOUT,
+    LLM_PROVIDER, LLM_CACHE, LLM_CACHE_MAX_ENTRIES, LLM_CACHE_PATH, LLM_STUB_LATENCY
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+# Zone relative dates are resolved in (see app/utils/dates.py)
+_CACHE_ZONE = ZoneInfo("Europe/London")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Whitespace-insensitive form of a prompt used as the cache key.
+
+    Case is kept: the prompt carries the user's words, the tool observations
+    and the history, and a cached answer must not replay another user's casing.
+    """
+    return _WHITESPACE_RE.sub(" ", prompt).strip()
+
+
+class NormalizingCache(BaseCache):
+    """
+    LangChain cache that normalises prompts before delegating to a backend.
+
+    Keys combine the local date and the normalised prompt with LangChain's
+    llm_string, which already encodes the model name, temperature and other
+    settings. A response is only replayed on the day it was cached.
+
+    Attributes:
+        backend (BaseCache): Cache storing the generations
+    """
+
+    def __init__(self, backend: BaseCache) -> None:
+        self.backend = backend
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[List[Any]]:
+        """Return cached generations for the prompt, or None."""
+        generations = self.backend.lookup(self._key(prompt), llm_string)
+        with self._lock:
+            self._stats["hits" if generations is not None else "misses"] += 1
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: List[Any]) -> None:
+        """Store generations for the prompt."""
+        self.backend.update(self._key(prompt), llm_string, return_val)
+
+    def clear(self, **kwargs: Any) -> None:
+        """Drop every cached response."""
+        self.backend.clear(**kwargs)
+
+    @staticmethod
+    def _key(prompt: str) -> str:
+        """Backend key: the local date, a space, then the normalised prompt."""
+        return f"{datetime.now(_CACHE_ZONE).date().isoformat()} {normalize_prompt(prompt)}"
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for monitoring."""
+        with self._lock:
+            return {"backend": LLM_CACHE, **self._stats}
+
+
+class BoundedSQLiteCache(SQLiteCache):
+    """
+    SQLiteCache holding at most ``max_entries`` responses, all from today.
+
+    Keys from NormalizingCache start with their day, so the first write of a
+    new day deletes every other day's rows, and each write deletes the oldest
+    rows beyond the cap.
+
+    Attributes:
+        max_entries (int): Maximum number of cached responses
+    """
+
+    def __init__(self, database_path: str, max_entries: int) -> None:
+        super().__init__(database_path=database_path)
+        self.max_entries = max_entries
+        self._day: Optional[str] = None
+
+    def update(self, prompt: str, llm_string: str, return_val: List[Any]) -> None:
+        """Store generations for the prompt, then prune old days and excess rows."""
+        super().update(prompt, llm_string, return_val)
+        table = self.cache_schema.__tablename__
+        day = prompt.split(" ", 1)[0]
+        with self.engine.begin() as connection:
+            if day != self._day:
+                connection.execute(
+                    text(f"DELETE FROM {table} WHERE prompt NOT LIKE :day"),
+                    {"day": f"{day} %"},
+                )
+                self._day = day
+            connection.execute(
+                text(
+                    f"DELETE FROM {table} WHERE rowid NOT IN "
+                    f"(SELECT rowid FROM {table} ORDER BY rowid DESC LIMIT :n)"
+                ),
+                {"n": self.max_entries},
+            )
+
+
+class StubChatModel(BaseChatModel):
+    """
+    Deterministic offline chat model for local runs and cache checks.
+
+    Always answers directly in the conversational agent's format, echoing
+    the latest user message after an optional simulated latency. Async
+    calls report the answer token by token.
+    """
+
+    latency: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"model_name": "stub"}
+
+    def _reply(self, messages: List[BaseMessage]) -> str:
+        last = next(
+            (m.content for m in reversed(messages) if isinstance(m, HumanMessage)), ""
+        )
+        last = str(last).rsplit("New input:", 1)[-1].split("\n", 1)[0].strip()
+        return f"Thought: Do I need to use a tool? No\nAI: (stub) You said: {last}"
+
+    def _generate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs) -> ChatResult:
+        if self.latency:
+            time.sleep(self.latency)
+        reply = self._reply(messages)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=reply))])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs) -> ChatResult:
+        # Latency is spread over word-by-word tokens, like a streaming API
+        reply = self._reply(messages)
+        words = reply.split(" ")
+        for i, word in enumerate(words):
+            if self.latency:
+                await asyncio.sleep(self.latency / len(words))
+            if run_manager:
+                await run_manager.on_llm_new_token(word if i == len(words) - 1 else word + " ")
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=reply))])
+
+
+def _build_cache() -> Optional[NormalizingCache]:
+    if LLM_CACHE == "memory":
+        return NormalizingCache(InMemoryCache(maxsize=LLM_CACHE_MAX_ENTRIES))
+    if LLM_CACHE == "sqlite":
+        return NormalizingCache(BoundedSQLiteCache(LLM_CACHE_PATH, LLM_CACHE_MAX_ENTRIES))
+    return None
+
+
+llm_cache = _build_cache()
+
+
+@lru_cache(maxsize=1)
+def get_llm() -> BaseChatModel:
+    """Return the shared chat model, wired to the configured response cache."""
+    # cache=False opts out of any global LangChain cache when caching is disabled
+    cache = llm_cache if llm_cache is not None else False
+    if LLM_PROVIDER == "stub":
+        return StubChatModel(latency=LLM_STUB_LATENCY, cache=cache)
+    return ChatOpenAI(
+        model_name=OPENAI_MODEL,
+        temperature=OPENAI_TEMPERATURE,
+        max_tokens=OPENAI_MAX_TOKENS,
+        request_timeout=OPENAI_TIMEOUT,
+        streaming=True,  # tokens reach callbacks for /api/chat/stream
+        cache=cache,
+    )
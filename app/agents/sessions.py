@@ -0,0 +1,130 @@
+"""
+Per-session chat agents.
+
+Each chat session gets its own windowed conversation memory and agent, so
+users never see each other's history and the prompt carries at most the
+last few turns however long a conversation runs. The agent (and with it
+the LLM client) is only built once a turn needs it, so turns answered
+without the LLM can still be recorded in memory. Sessions are kept in a
+bounded LRU store: idle sessions expire and the least recently used one is
+evicted when the store is full, which caps the memory held for all users.
+
+Author: AI Assistant
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.config import CHAT_MAX_SESSIONS, CHAT_SESSION_TTL
+
+SessionKey = Tuple[str, str]
+
+
+@dataclass
+class ChatSession:
+    """
+    One conversation's memory and agent.
+
+    Attributes:
+        memory: The conversation memory the agent reads and writes
+        build_agent: Builds the LangChain agent around ``memory``
+        lock: Serialises turns, since concurrent turns would interleave memory
+        last_used: Monotonic time of the last turn
+    """
+
+    memory: Any
+    build_agent: Callable[[Any], Any]
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    last_used: float = field(default_factory=time.monotonic)
+    _agent: Any = field(default=None, init=False, repr=False)
+
+    @property
+    def agent(self) -> Any:
+        """The session's agent, built on first use; access it under ``lock``."""
+        if self._agent is None:
+            self._agent = self.build_agent(self.memory)
+        return self._agent
+
+
+class SessionStore:
+    """
+    Bounded LRU store of chat sessions with idle expiry.
+
+    Sessions are keyed on (restaurant, session_id) so the same id cannot
+    carry history from one restaurant's agent into another's.
+
+    Attributes:
+        max_sessions (int): Maximum number of live sessions
+        ttl (float): Seconds a session may stay idle before it is dropped
+    """
+
+    def __init__(self, max_sessions: int, ttl: float) -> None:
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._sessions: "OrderedDict[SessionKey, ChatSession]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "created": 0, "evictions": 0, "expirations": 0}
+
+    def get_or_create(
+        self,
+        restaurant: str,
+        session_id: Optional[str],
+        factory: Callable[[str], ChatSession]
+    ) -> Tuple[str, ChatSession]:
+        """
+        Return the session for this id, creating it if unknown or expired.
+
+        Args:
+            restaurant: Restaurant the session's agent acts for
+            session_id: Client-supplied session id; a new one is issued if None
+            factory: Builds a fresh session for a restaurant
+
+        Returns:
+            Tuple[str, ChatSession]: The session id and its session
+        """
+        session_id = session_id or uuid.uuid4().hex
+        key = (restaurant, session_id)
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            session = self._sessions.get(key)
+            if session is not None:
+                session.last_used = now
+                self._sessions.move_to_end(key)
+                self._stats["hits"] += 1
+                return session_id, session
+
+        # Build outside the lock; session construction is comparatively slow
+        created = factory(restaurant)
+        with self._lock:
+            session = self._sessions.setdefault(key, created)
+            session.last_used = time.monotonic()
+            self._sessions.move_to_end(key)
+            if session is created:
+                self._stats["created"] += 1
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self._stats["evictions"] += 1
+        return session_id, session
+
+    def _expire(self, now: float) -> None:
+        """Drop idle sessions; least recently used sessions are at the front."""
+        while self._sessions:
+            key, session = next(iter(self._sessions.items()))
+            if now - session.last_used < self.ttl:
+                return
+            del self._sessions[key]
+            self._stats["expirations"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/create/eviction/expiration counters and size for monitoring."""
+        with self._lock:
+            return {**self._stats, "sessions": len(self._sessions)}
+
+
+chat_sessions = SessionStore(CHAT_MAX_SESSIONS, CHAT_SESSION_TTL)
@@ -0,0 +1,83 @@
+"""
+Agent progress events for the streaming chat endpoint.
+
+A LangChain callback handler turns an agent run into a sequence of events
+(tool calls starting and finishing, tokens of the final answer) on an
+asyncio queue that the endpoint relays to the client as Server-Sent Events
+while the agent is still working.
+
+Author: AI Assistant
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, Set, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+
+# The conversational agent prefixes its final answer with "AI:"; everything
+# before it (thoughts, tool selection) is scaffolding the user should not see
+ANSWER_PREFIX = "AI:"
+
+Event = Tuple[str, Dict[str, Any]]
+
+
+class StreamingHandler(AsyncCallbackHandler):
+    """
+    Collects tool progress and final-answer tokens of one agent run.
+
+    Events are queued thread-safely, so callbacks fired from worker threads
+    are delivered on the event loop that created the handler.
+    """
+
+    def __init__(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._queue: "asyncio.Queue[Event]" = asyncio.Queue()
+        self._buffers: Dict[UUID, str] = {}
+        self._answering: Set[UUID] = set()
+
+    def _emit(self, event: str, data: Dict[str, Any]) -> None:
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, (event, data))
+
+    async def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        """Forward tokens once the model has started its final answer."""
+        if run_id in self._answering:
+            self._emit("token", {"text": token})
+            return
+        buffer = self._buffers.get(run_id, "") + token
+        if ANSWER_PREFIX in buffer:
+            self._buffers.pop(run_id, None)
+            self._answering.add(run_id)
+            text = buffer.split(ANSWER_PREFIX, 1)[1].lstrip()
+            if text:
+                self._emit("token", {"text": text})
+        else:
+            self._buffers[run_id] = buffer
+
+    async def on_tool_start(self, serialized: Dict[str, Any], input_str: str, **kwargs: Any) -> None:
+        """Report which tool the agent is calling."""
+        self._emit("tool", {"name": serialized.get("name"), "input": input_str})
+
+    async def on_tool_end(self, output: Any, **kwargs: Any) -> None:
+        """Report that the current tool call finished."""
+        self._emit("tool_end", {"name": kwargs.get("name")})
+
+    async def events(self, run: "asyncio.Future[Any]") -> AsyncIterator[Event]:
+        """
+        Yield queued events until ``run`` completes, then drain the rest.
+
+        Args:
+            run: Task running the agent with this handler attached
+        """
+        while True:
+            get = asyncio.ensure_future(self._queue.get())
+            done, _ = await asyncio.wait({get, run}, return_when=asyncio.FIRST_COMPLETED)
+            if get in done:
+                yield get.result()
+                continue
+            get.cancel()
+            # Let callbacks scheduled just before completion land in the queue
+            await asyncio.sleep(0)
+            while not self._queue.empty():
+                yield self._queue.get_nowait()
+            return
@@ -1,13 +1,16 @@
 """
-LangChain Tools for The Hungry Unicorn.
+LangChain Tools for the restaurant booking API.
+
+Every tool takes the restaurant it acts for; get_tools() binds it so one
+deployment can run an agent per restaurant.
 """
 
-import requests
-from datetime import datetime, date as _date
+import asyncio
+from datetime import date as _date
+from functools import partial
 
 from langchain.agents import Tool
 
-from app.core.config import API_BASE, BACKEND_TOKEN
 from app.utils.dates import resolve_dates
 from app.utils.nlp import (
     parse_input,
@@ -15,9 +18,14 @@ from app.utils.nlp import (
     normalize_time,
     normalize_party_size,
 )
-from app.utils.formatting import pretty_date, pretty_time
+from app.core.cache import availability_cache, tool_cache
+from app.core.config import RESTAURANT_NAME
+from app.utils.formatting import pretty_date, pretty_time, pretty_restaurant
 from app.services.restaurant_api import (
     availability as api_availability,
+    availability_range as api_availability_range,
+    availability_many as api_availability_many,
+    is_unsupported as api_is_unsupported,
     create_booking as api_create_booking,
     get_booking as api_get_booking,
     update_booking as api_update_booking,
@@ -25,26 +33,36 @@ from app.services.restaurant_api import (
 )
 
 
-def check_availability_tool(input_text: str) -> str:
+def _forget_availability(restaurant: str) -> None:
+    """Drop memoised availability after this agent changed a booking."""
+    tool_cache.invalidate_where(lambda key: key[0] == restaurant)
+
+
+# Booking changes made in this process (API routes, imports, maintenance) are
+# keyed by restaurant id, so they clear the whole, short-lived memo
+availability_cache.add_invalidation_listener(lambda restaurant_id, visit_dates: tool_cache.clear())
+
+
+def check_availability_tool(input_text: str, restaurant: str = RESTAURANT_NAME) -> str:
     """
     Accepts either:
       - VisitDate as ISO 'YYYY-MM-DD'
       - or natural language like 'this weekend', 'next Friday'
     Always needs PartySize and ChannelCode.
     """
+    params = parse_input(input_text)
+
     # Try natural-language resolution first
     resolved = resolve_dates(input_text)
     if resolved:
         dates = [r.iso_date for r in resolved]   # weekend [Sat, Sun]
     else:
         # fallback to specific date passed by the agent
-        params = parse_input(input_text)
         if "visitdate" not in params:
             return "Any specific date you'd like to check availability for?."
         dates = [params["visitdate"]]
 
     # party size & channel required
-    params = parse_input(input_text)
     if "partysize" not in params or "channelcode" not in params:
         return "Please specify for how many people you want to check availability for?."
     party = params["partysize"]
@@ -56,26 +74,33 @@ def check_availability_tool(input_text: str) -> str:
     if not dates:
         return "That date looks like it's in the past. Please choose a future date."
 
+    # One range search covers every resolved date (e.g. both weekend days),
+    # memoised briefly for repeated questions. Backends without the range
+    # endpoint are searched one date at a time, concurrently, answering with
+    # whichever dates came back; any other failure would only repeat per date.
+    memo_key = (restaurant, min(dates), max(dates), str(party), channel)
+    times_by_date = tool_cache.get(memo_key)
+    if times_by_date is None:
+        try:
+            times_by_date = api_availability_range(
+                min(dates), max(dates), party, channel, restaurant=restaurant
+            )
+            tool_cache.set(memo_key, times_by_date)
+        except Exception as e:
+            if not api_is_unsupported(e):
+                return "Sorry, I couldn't retrieve availability right now. Please try again later."
+            times_by_date = api_availability_many(dates, party, channel, restaurant=restaurant)
+            if all(isinstance(t, Exception) for t in times_by_date.values()):
+                return "Sorry, I couldn't retrieve availability right now. Please try again later."
+
     results = []
     for d in dates:
-        resp = requests.post(
-            f"{API_BASE}/api/ConsumerApi/v1/Restaurant/TheHungryUnicorn/AvailabilitySearch",
-            headers={"Authorization": f"Bearer {BACKEND_TOKEN}"},
-            data={"VisitDate": d, "PartySize": party, "ChannelCode": channel},
-        )
-        if not resp.ok:
-            return "Sorry, I couldn't retrieve availability right now. Please try again later."
-
-        slots = resp.json().get("available_slots", [])
-        times = [s.get("time") for s in slots if s.get("available")]
-
-        if times:
-            def pretty(t: str) -> str:
-                return datetime.strptime(t, "%H:%M:%S").strftime("%I:%M %p").lstrip("0")
-
-            human_times = ", ".join(pretty(t) for t in times)
-            daylabel = datetime.strptime(d, "%Y-%m-%d").strftime("%A %b %d, %Y")
-            results.append(f"on {daylabel}: {human_times}")
+        times = times_by_date.get(d, [])
+        if isinstance(times, Exception):
+            results.append(f"on {pretty_date(d)}: I couldn't check this date right now")
+        elif times:
+            human_times = ", ".join(pretty_time(t) for t in times)
+            results.append(f"on {pretty_date(d)}: {human_times}")
         else:
             results.append(f"on {d}: no available slots")
 
@@ -90,7 +115,7 @@ def check_availability_tool(input_text: str) -> str:
         return f"Available times {results[0]}. Would you like to book this slot?"
 
 
-def create_booking_tool(input_text: str) -> str:
+def create_booking_tool(input_text: str, restaurant: str = RESTAURANT_NAME) -> str:
     params = parse_input(input_text)
 
     # Normalize from explicit params or natural language
@@ -109,7 +134,8 @@ def create_booking_tool(input_text: str) -> str:
 
     # Availability pre-check 
     try:
-        times = api_availability(visit_date, int(party), channel)  # expects HH:MM:SS strings
+        # expects HH:MM:SS strings
+        times = api_availability(visit_date, int(party), channel, restaurant=restaurant)
     except Exception:
         return "Sorry, I couldn't check availability for your booking. Please try again later."
 
@@ -133,25 +159,26 @@ def create_booking_tool(input_text: str) -> str:
             form[f"Customer[{fld.capitalize()}]"] = params[fld]
 
     try:
-        b = api_create_booking(form)
+        b = api_create_booking(form, restaurant=restaurant)
     except Exception:
         return "Sorry, I couldn't create the booking. Please check your details and try again."
+    _forget_availability(restaurant)
 
     return (
         f"Your booking for {pretty_date(b['visit_date'])} at {pretty_time(b['visit_time'])} "
         f"for a party of {party} is confirmed! Reference: {b.get('booking_reference')}. "
-        "Looking forward to seeing you at The Hungry Unicorn."
+        f"Looking forward to seeing you at {pretty_restaurant(restaurant)}."
     )
 
 
-def get_booking_tool(input_text: str) -> str:
+def get_booking_tool(input_text: str, restaurant: str = RESTAURANT_NAME) -> str:
     params = parse_input(input_text)
     ref = params.get("booking_reference") or params.get("reference")
     if not ref:
         return "Please provide your booking reference so I can look it up."
 
     try:
-        b = api_get_booking(ref)
+        b = api_get_booking(ref, restaurant=restaurant)
     except Exception:
         return "Sorry, I couldn't retrieve your booking right now. Please try again later."
     if not b:
@@ -163,7 +190,7 @@ def get_booking_tool(input_text: str) -> str:
     )
 
 
-def update_booking_tool(input_text: str) -> str:
+def update_booking_tool(input_text: str, restaurant: str = RESTAURANT_NAME) -> str:
     params = parse_input(input_text)
 
     # accept both keys
@@ -199,15 +226,16 @@ def update_booking_tool(input_text: str) -> str:
         return "No changes specified. You can update date, time, party size or special requests."
 
     try:
-        api_update_booking(ref, data)
+        api_update_booking(ref, data, restaurant=restaurant)
     except Exception:
         return "Sorry, I couldn't update your booking. Please try again."
+    _forget_availability(restaurant)
 
     return f"Your booking {ref} has been updated successfully!"
 
 
 
-def cancel_booking_tool(input_text: str) -> str:
+def cancel_booking_tool(input_text: str, restaurant: str = RESTAURANT_NAME) -> str:
     params = parse_input(input_text)
     ref = params.get("booking_reference")
     reason = params.get("cancellationreasonid")
@@ -215,21 +243,30 @@ def cancel_booking_tool(input_text: str) -> str:
         return "What's your booking reference number?" # Possible future enhancement: list reasons for feedback
 
     try:
-        api_cancel_booking(ref, int(reason))
+        api_cancel_booking(ref, int(reason), restaurant=restaurant)
     except Exception:
         return "Sorry, I couldn't cancel your booking. Please verify your reference and try again."
+    _forget_availability(restaurant)
 
     return f"Your booking {ref} has been cancelled."
 
 
-def get_tools():
-    """Return LangChain Tool objects."""
+def _in_thread(tool, restaurant: str):
+    """Async form of a tool for agent.arun; the blocking API calls run off the event loop."""
+    async def run(input_text: str) -> str:
+        return await asyncio.to_thread(tool, input_text, restaurant=restaurant)
+    return run
+
+
+def get_tools(restaurant: str = RESTAURANT_NAME):
+    """Return LangChain Tool objects acting for the given restaurant."""
     return [
         Tool(
             name="Check Availability",
-            func=check_availability_tool,
+            func=partial(check_availability_tool, restaurant=restaurant),
+            coroutine=_in_thread(check_availability_tool, restaurant),
             description=(
-                "Check availability at TheHungryUnicorn. "
+                f"Check availability at {restaurant}. "
                 "VisitDate may be an ISO date (YYYY-MM-DD) OR a phrase like "
                 "'this weekend', 'next Friday', 'this Sunday'. "
                 "Always include PartySize and ChannelCode: ONLINE."
@@ -237,7 +274,8 @@ def get_tools():
         ),
         Tool(
             name="Create Booking",
-            func=create_booking_tool,
+            func=partial(create_booking_tool, restaurant=restaurant),
+            coroutine=_in_thread(create_booking_tool, restaurant),
             description=(
                 "Book a table. Understands natural language like "
                 "'book for 4 next Friday at 7pm'. Defaults ChannelCode to ONLINE. "
@@ -246,12 +284,14 @@ def get_tools():
         ),
         Tool(
             name="Get Booking",
-            func=get_booking_tool,
+            func=partial(get_booking_tool, restaurant=restaurant),
+            coroutine=_in_thread(get_booking_tool, restaurant),
             description="Input 'Booking_Reference:XYZ'",
         ),
         Tool(
             name="Update Booking",
-            func=update_booking_tool,
+            func=partial(update_booking_tool, restaurant=restaurant),
+            coroutine=_in_thread(update_booking_tool, restaurant),
             description=(
                 "Input 'Booking_Reference:XYZ, VisitDate:..., VisitTime:..., "
                 "PartySize:..., SpecialRequests:..., IsLeaveTimeConfirmed:...'"
@@ -259,7 +299,8 @@ def get_tools():
         ),
         Tool(
             name="Cancel Booking",
-            func=cancel_booking_tool,
+            func=partial(cancel_booking_tool, restaurant=restaurant),
+            coroutine=_in_thread(cancel_booking_tool, restaurant),
             description="Input 'Booking_Reference:XYZ, CancellationReasonId:N'",
         ),
     ]
@@ -0,0 +1,215 @@
+"""
+In-process availability cache.
+
+Availability for a restaurant/date only changes when a booking on that date
+is created, moved or cancelled, so search results are cached here and the
+booking write paths invalidate the affected dates after they commit. A TTL
+bounds staleness from writers in other processes. Each invalidation bumps a
+generation for the restaurant/date; a search records it before reading the
+database and its result is dropped if a write invalidated the date in the
+meantime, so a read from before a commit never refills the cache after it.
+
+A generic TTL cache is also provided; the chat agent memoises its
+availability answers in one and clears it whenever availability changes.
+
+Author: AI Assistant
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from app.core.config import (
+    AVAILABILITY_CACHE_MAX_ENTRIES, AVAILABILITY_CACHE_TTL, TOOL_CACHE_MAX_ENTRIES,
+    TOOL_CACHE_TTL
+)
+
+CacheKey = Tuple[int, date, int]
+
+
+class AvailabilityCache:
+    """
+    Bounded LRU cache with per-entry TTL for availability search results.
+
+    Entries are keyed on (restaurant_id, visit_date, party_size) and can be
+    invalidated for a whole restaurant/date regardless of party size.
+
+    Attributes:
+        max_entries (int): Maximum number of cached searches
+        ttl (float): Seconds an entry stays valid
+    """
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[CacheKey, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._party_sizes: Dict[Tuple[int, date], Set[int]] = {}
+        self._generations: Dict[Tuple[int, date], int] = {}
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[int, Tuple[date, ...]], None]] = []
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+            "stale_sets": 0,
+        }
+
+    def get(self, restaurant_id: int, visit_date: date, party_size: int) -> Optional[List[Dict[str, Any]]]:
+        """Return cached slots, or None on a miss or expired entry."""
+        key = (restaurant_id, visit_date, party_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            expires_at, slots = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return slots
+
+    def generation(self, restaurant_id: int, visit_date: date) -> int:
+        """Return the invalidation generation of a restaurant/date; read it before searching."""
+        with self._lock:
+            return self._generations.get((restaurant_id, visit_date), 0)
+
+    def set(self, restaurant_id: int, visit_date: date, party_size: int,
+            slots: List[Dict[str, Any]], generation: Optional[int] = None) -> None:
+        """
+        Cache slots for a search, evicting the least recently used entry if full.
+
+        Args:
+            generation: The date's generation() from before the search read the
+                database; the slots are dropped if it has been invalidated since
+        """
+        if self.max_entries <= 0:
+            return
+        key = (restaurant_id, visit_date, party_size)
+        with self._lock:
+            current = self._generations.get((restaurant_id, visit_date), 0)
+            if generation is not None and generation != current:
+                self._stats["stale_sets"] += 1
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, slots)
+            self._entries.move_to_end(key)
+            self._party_sizes.setdefault((restaurant_id, visit_date), set()).add(party_size)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, restaurant_id: int, *visit_dates: date) -> None:
+        """Drop every cached party size for the given restaurant and dates."""
+        with self._lock:
+            for visit_date in set(visit_dates):
+                day = (restaurant_id, visit_date)
+                self._generations[day] = self._generations.get(day, 0) + 1
+                for party_size in self._party_sizes.pop((restaurant_id, visit_date), set()):
+                    self._entries.pop((restaurant_id, visit_date, party_size), None)
+                    self._stats["invalidations"] += 1
+        for listener in self._listeners:
+            listener(restaurant_id, visit_dates)
+
+    def add_invalidation_listener(self, listener: Callable[[int, Tuple[date, ...]], None]) -> None:
+        """Call ``listener(restaurant_id, visit_dates)`` whenever availability changes."""
+        self._listeners.append(listener)
+
+    def clear(self) -> None:
+        """Drop all entries, keeping the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._party_sizes.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters and current size for monitoring."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+            }
+
+    def _remove(self, key: CacheKey) -> None:
+        """Remove one entry and its date index (caller holds the lock)."""
+        self._entries.pop(key, None)
+        restaurant_id, visit_date, party_size = key
+        sizes = self._party_sizes.get((restaurant_id, visit_date))
+        if sizes is not None:
+            sizes.discard(party_size)
+            if not sizes:
+                del self._party_sizes[(restaurant_id, visit_date)]
+
+
+class TTLCache:
+    """
+    Bounded LRU cache with per-entry TTL for arbitrary hashable keys.
+
+    Attributes:
+        max_entries (int): Maximum number of cached values
+        ttl (float): Seconds an entry stays valid
+    """
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None on a miss or expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                self._entries.pop(key, None)
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value, evicting the least recently used entry if full."""
+        if self.max_entries <= 0 or self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key satisfies ``predicate``."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+                self._stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        """Drop all entries, keeping the counters."""
+        with self._lock:
+            self._stats["invalidations"] += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters and current size for monitoring."""
+        with self._lock:
+            return {**self._stats, "size": len(self._entries), "ttl_seconds": self.ttl}
+
+
+availability_cache = AvailabilityCache(AVAILABILITY_CACHE_MAX_ENTRIES, AVAILABILITY_CACHE_TTL)
+
+# Availability answers of the chat agent's tool, keyed on restaurant name
+tool_cache = TTLCache(TOOL_CACHE_MAX_ENTRIES, TOOL_CACHE_TTL)
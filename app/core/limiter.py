@@ -0,0 +1,75 @@
+"""
+Concurrency limiter for long-running async work.
+
+A chat turn holds an LLM conversation open for seconds. The limiter bounds
+how many run at once, lets a bounded number of callers queue for a slot
+for a limited time, and turns everything beyond that into an immediate
+rejection the caller can report as back-pressure (HTTP 429).
+
+Author: AI Assistant
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+
+
+class Overloaded(Exception):
+    """Raised when no slot is free and the queue is full or the wait timed out."""
+
+
+class ConcurrencyLimiter:
+    """
+    Semaphore with a bounded, timed wait queue.
+
+    Must be used from a single event loop.
+
+    Attributes:
+        max_concurrent (int): Maximum number of holders at once
+        max_queued (int): Maximum number of callers waiting for a slot
+        queue_timeout (float): Seconds a caller may wait for a slot
+    """
+
+    def __init__(self, max_concurrent: int, max_queued: int, queue_timeout: float) -> None:
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._active = 0
+        self._waiting = 0
+        self._stats = {"admitted": 0, "rejected": 0, "timeouts": 0}
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Hold one slot for the duration of the ``async with`` block.
+
+        Raises:
+            Overloaded: If the queue is full or no slot freed up in time
+        """
+        # Counted here rather than via the semaphore, whose state lags behind
+        # acquisitions that are still pending on the event loop
+        if self._active + self._waiting >= self.max_concurrent + self.max_queued:
+            self._stats["rejected"] += 1
+            raise Overloaded("Too many requests waiting")
+
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._stats["timeouts"] += 1
+            raise Overloaded("Timed out waiting for a free slot")
+        finally:
+            self._waiting -= 1
+
+        self._active += 1
+        self._stats["admitted"] += 1
+        try:
+            yield
+        finally:
+            self._active -= 1
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return admission counters and current occupancy for monitoring."""
+        return {**self._stats, "active": self._active, "waiting": self._waiting}
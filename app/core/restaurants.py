@@ -0,0 +1,99 @@
+"""
+In-memory restaurant directory.
+
+Every API route addresses a restaurant by name, so the name (or microsite
+name) to id mapping is kept in memory instead of being queried on each
+request. The directory is loaded at startup and reloaded when restaurants
+are created; an unknown name also triggers a reload, rate limited so that
+repeated bad names cannot turn into one query per request, which picks up
+restaurants added by other processes.
+
+Author: AI Assistant
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select
+
+from app.core.config import RESTAURANT_DIRECTORY_REFRESH
+from app.database import engine
+from app.models import Restaurant
+
+
+class RestaurantDirectory:
+    """
+    Thread-safe name/microsite name to id map of all restaurants.
+
+    Attributes:
+        refresh_interval (float): Minimum seconds between reloads triggered
+            by a lookup miss
+    """
+
+    def __init__(self, refresh_interval: float) -> None:
+        self.refresh_interval = refresh_interval
+        self._ids: Dict[str, int] = {}
+        self._names: Dict[int, str] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._stats = {"lookups": 0, "misses": 0, "reloads": 0}
+
+    def load(self) -> None:
+        """Replace the directory with the current contents of the restaurants table."""
+        with engine.connect() as connection:
+            rows = connection.execute(
+                select(Restaurant.id, Restaurant.name, Restaurant.microsite_name)
+            ).all()
+
+        ids = {}
+        for restaurant_id, name, microsite_name in rows:
+            ids[microsite_name] = restaurant_id
+        for restaurant_id, name, microsite_name in rows:
+            ids[name] = restaurant_id  # names win over microsite names
+
+        with self._lock:
+            self._ids = ids
+            self._names = {restaurant_id: name for restaurant_id, name, _ in rows}
+            self._loaded_at = time.monotonic()
+            self._stats["reloads"] += 1
+
+    def resolve(self, name: str) -> Optional[int]:
+        """
+        Return the id of the restaurant with this name or microsite name.
+
+        Args:
+            name: Restaurant name or microsite name
+
+        Returns:
+            Optional[int]: The restaurant id, or None if no restaurant matches
+        """
+        with self._lock:
+            self._stats["lookups"] += 1
+            restaurant_id = self._ids.get(name)
+            if restaurant_id is not None:
+                return restaurant_id
+            self._stats["misses"] += 1
+            now = time.monotonic()
+            if self._loaded_at is not None and now - self._loaded_at < self.refresh_interval:
+                return None
+            # Claim the reload before running it, so concurrent misses see a
+            # fresh directory and only this caller queries the database
+            self._loaded_at = now
+
+        self.load()
+        with self._lock:
+            return self._ids.get(name)
+
+    def names(self) -> List[str]:
+        """Return the canonical name of every restaurant."""
+        with self._lock:
+            return sorted(self._names.values())
+
+    def stats(self) -> Dict[str, Any]:
+        """Return lookup/miss/reload counters and size for monitoring."""
+        with self._lock:
+            return {**self._stats, "restaurants": len(self._names)}
+
+
+restaurant_directory = RestaurantDirectory(RESTAURANT_DIRECTORY_REFRESH)
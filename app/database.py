@@ -1,27 +1,77 @@
 """
 Database Configuration and Session Management.
 
-This module sets up the SQLite database connection, session management,
-and declarative base for the restaurant booking mock API.
+This module sets up the database connection, session management,
+and declarative base for the restaurant booking mock API. SQLite is used
+by default; any SQLAlchemy URL (e.g. PostgreSQL) can be configured through
+DATABASE_URL.
 
 Author: AI Assistant
 """
 
-from typing import Generator
+from typing import Any, Dict, Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 
-# SQLite database URL - creates file in project root
-SQLALCHEMY_DATABASE_URL = "sqlite:///./restaurant_booking.db"
-
-# Create SQLAlchemy engine with SQLite-specific configuration
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Required for SQLite threading
+from app.core.config import (
+    DATABASE_URL, SQLITE_JOURNAL_MODE, SQLITE_SYNCHRONOUS, SQLITE_MMAP_SIZE,
+    SQLITE_CACHE_SIZE, SQLITE_BUSY_TIMEOUT, SQLITE_TEMP_STORE, DB_POOL_SIZE,
+    DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_PRE_PING, DB_POOL_RECYCLE
 )
 
+# Database URL - defaults to a SQLite file in the project root
+SQLALCHEMY_DATABASE_URL = DATABASE_URL
+
+_url = make_url(SQLALCHEMY_DATABASE_URL)
+IS_SQLITE = _url.get_backend_name() == "sqlite"
+
+# Pragmas applied to every new SQLite connection. WAL lets availability
+# reads run concurrently with booking commits; NORMAL sync is durable in
+# WAL mode except for the last transactions on power loss.
+SQLITE_PRAGMAS = {
+    "journal_mode": SQLITE_JOURNAL_MODE,
+    "synchronous": SQLITE_SYNCHRONOUS,
+    "mmap_size": SQLITE_MMAP_SIZE,
+    "cache_size": SQLITE_CACHE_SIZE,
+    "busy_timeout": SQLITE_BUSY_TIMEOUT,
+    "temp_store": SQLITE_TEMP_STORE,
+}
+
+engine_options: Dict[str, Any] = {
+    "pool_pre_ping": DB_POOL_PRE_PING,
+    "pool_recycle": DB_POOL_RECYCLE,
+}
+if IS_SQLITE:
+    engine_options["connect_args"] = {"check_same_thread": False}  # Required for SQLite threading
+
+# In-memory SQLite uses a single-connection pool that takes no sizing options
+if not (IS_SQLITE and _url.database in (None, "", ":memory:")):
+    engine_options.update(
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT
+    )
+
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **engine_options)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply the configured SQLite performance profile to a new connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma, value in SQLITE_PRAGMAS.items():
+            if value:
+                cursor.execute(f"PRAGMA {pragma}={value}")
+    finally:
+        cursor.close()
+
+
+if IS_SQLITE:
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -9,10 +9,75 @@ Author: AI Assistant
 """
 
 import random
-from datetime import time, datetime, timedelta
+from dataclasses import dataclass
+from datetime import date, time, datetime, timedelta
+from itertools import product
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from sqlalchemy import column, delete, func, insert, inspect, select, table, text, update
+from sqlalchemy.engine import Connection
 
 from app.database import engine, SessionLocal
-from app.models import Base, Restaurant, AvailabilitySlot, CancellationReason
+from app.models import (
+    Base, Restaurant, Booking, AvailabilitySlot, CancellationReason, SchemaVersion
+)
+
+# Latest schema version; bump it together with a new entry in MIGRATIONS
+SCHEMA_VERSION = 4
+
+
+def _add_hot_path_indexes(connection: Connection) -> None:
+    """Create the booking and availability search/listing indexes if missing."""
+    for model_table in (Booking.__table__, AvailabilitySlot.__table__):
+        for index in model_table.indexes:
+            # Unique indexes need existing duplicates removed first
+            if not index.unique:
+                index.create(bind=connection, checkfirst=True)
+
+
+def _backfill_confirmed_counts(connection: Connection) -> None:
+    """Recompute every slot's confirmed_count from its confirmed bookings."""
+    confirmed = select(func.count(Booking.id)).where(
+        Booking.restaurant_id == AvailabilitySlot.restaurant_id,
+        Booking.visit_date == AvailabilitySlot.date,
+        Booking.visit_time == AvailabilitySlot.time,
+        Booking.status == "confirmed"
+    ).scalar_subquery()
+    connection.execute(update(AvailabilitySlot).values(confirmed_count=confirmed))
+
+
+def _add_slot_confirmed_count(connection: Connection) -> None:
+    """Add the slot capacity counter and backfill it from confirmed bookings."""
+    columns = {column["name"] for column in inspect(connection).get_columns("availability_slots")}
+    if "confirmed_count" not in columns:
+        connection.execute(text(
+            "ALTER TABLE availability_slots "
+            "ADD COLUMN confirmed_count INTEGER NOT NULL DEFAULT 0"
+        ))
+    _backfill_confirmed_counts(connection)
+
+
+def _add_slot_unique_index(connection: Connection) -> None:
+    """Drop duplicate slots, keeping the oldest, then make (restaurant, date, time) unique."""
+    slots = AvailabilitySlot.__table__
+    keep = select(func.min(slots.c.id)).group_by(
+        slots.c.restaurant_id, slots.c.date, slots.c.time
+    )
+    if connection.execute(delete(slots).where(slots.c.id.not_in(keep))).rowcount:
+        # Bookings counted on a dropped duplicate now count on the kept slot
+        _backfill_confirmed_counts(connection)
+    for index in slots.indexes:
+        if index.unique:
+            index.create(bind=connection, checkfirst=True)
+
+
+# Migration steps keyed by the schema version they upgrade to
+MIGRATIONS: Dict[int, Callable[[Connection], None]] = {
+    1: _add_hot_path_indexes,
+    2: _add_slot_confirmed_count,
+    3: _add_hot_path_indexes,  # bookings listing keyset index
+    4: _add_slot_unique_index,
+}
 
 
 def create_tables() -> None:
@@ -20,9 +85,191 @@ def create_tables() -> None:
     Create all database tables based on SQLAlchemy models.
 
     This function creates the database schema by calling SQLAlchemy's
-    metadata.create_all() method.
+    metadata.create_all() method, then upgrades an existing database to
+    the latest schema version.
     """
     Base.metadata.create_all(bind=engine)
+    upgrade_schema()
+
+
+def upgrade_schema() -> None:
+    """
+    Apply any pending schema migrations.
+
+    ``create_all`` only creates missing tables, so database files created
+    by an older release never receive new indexes or columns. Each step in
+    MIGRATIONS above the recorded version is applied and recorded in the
+    same transaction.
+    """
+    with engine.begin() as connection:
+        current = connection.execute(
+            select(func.max(SchemaVersion.version))
+        ).scalar() or 0
+
+        for version in range(current + 1, SCHEMA_VERSION + 1):
+            MIGRATIONS[version](connection)
+            connection.execute(insert(SchemaVersion).values(version=version))
+            print(f"Applied schema migration {version}")
+
+
+@dataclass(frozen=True)
+class OpeningHours:
+    """
+    Weekly opening-hours template used to generate availability slots.
+
+    Attributes:
+        services: (open, close) windows; seatings start every interval from
+            open up to but excluding close
+        interval_minutes: Minutes between seatings
+        max_party_size: Largest party each generated slot accepts
+        closed_weekdays: Weekdays with no service (0=Monday ... 6=Sunday)
+    """
+
+    services: Tuple[Tuple[time, time], ...] = (
+        (time(12, 0), time(14, 0)),
+        (time(19, 0), time(21, 0)),
+    )
+    interval_minutes: int = 30
+    max_party_size: int = 8
+    closed_weekdays: FrozenSet[int] = frozenset()
+
+    def slot_times(self) -> List[time]:
+        """Return the seating times of one service day."""
+        minutes = [
+            minute
+            for opens, closes in self.services
+            for minute in range(
+                opens.hour * 60 + opens.minute,
+                closes.hour * 60 + closes.minute,
+                self.interval_minutes
+            )
+        ]
+        return [time(minute // 60, minute % 60) for minute in minutes]
+
+
+# Lunch 12:00-13:30 and dinner 19:00-20:30, every half hour
+DEFAULT_OPENING_HOURS = OpeningHours()
+
+# Fraction of mock slots left bookable; the rest are generated unavailable
+SAMPLE_AVAILABILITY = 0.8
+
+# Columns written by the bulk slot generator, in insert order
+SLOT_COLUMNS = (
+    "restaurant_id", "date", "time", "max_party_size", "available",
+    "confirmed_count", "created_at"
+)
+
+
+def _driver_values(connection: Connection, column: str, values: List) -> List:
+    """Convert Python values to what the DBAPI driver expects for a slot column."""
+    column_type = AvailabilitySlot.__table__.c[column].type.dialect_impl(connection.dialect)
+    processor = column_type.bind_processor(connection.dialect)
+    return [processor(value) for value in values] if processor else list(values)
+
+
+def _insert_ignoring_duplicates(target, dialect):
+    """INSERT that skips rows conflicting with a unique index, in the dialect's syntax."""
+    if dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        return dialect_insert(target).on_conflict_do_nothing()
+    if dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        return dialect_insert(target).on_conflict_do_nothing()
+    return insert(target).prefix_with("IGNORE", dialect=("mysql", "mariadb"))
+
+
+def generate_slot_schedule(
+    connection: Connection,
+    templates: Dict[int, OpeningHours],
+    start_date: date,
+    days: int,
+    availability: float = 1.0,
+    seed: Optional[int] = None,
+    batch_size: int = 50000
+) -> int:
+    """
+    Bulk-generate availability slots from opening-hours templates.
+
+    The slot grid for each restaurant is the cross product of its open days
+    and its template's seating times. Dates and times are converted to
+    driver values once per distinct value rather than once per row, and
+    rows go to the driver as plain tuples through executemany in batches,
+    skipping per-object ORM work and per-row parameter processing.
+    Restaurant days that already have slots are skipped, so the generator
+    can be re-run over overlapping windows; rows another writer inserted
+    in the meantime are ignored by the unique (restaurant, date, time)
+    index instead of being duplicated.
+
+    Args:
+        connection: Connection whose transaction the slots are written in
+        templates: Opening hours keyed by restaurant id
+        start_date: First date to generate
+        days: Number of consecutive days to generate
+        availability: Fraction of slots left open; the rest are generated
+            closed at random
+        seed: Optional seed for reproducible closed slots
+        batch_size: Rows per executemany call
+
+    Returns:
+        int: Number of slots inserted
+    """
+    end_date = start_date + timedelta(days=days - 1)
+    dates = [start_date + timedelta(days=offset) for offset in range(days)]
+    existing = set(connection.execute(
+        select(AvailabilitySlot.restaurant_id, AvailabilitySlot.date).where(
+            AvailabilitySlot.restaurant_id.in_(templates),
+            AvailabilitySlot.date.between(start_date, end_date)
+        ).distinct()
+    ).tuples())
+
+    # A bare table() construct has no primary key, so no implicit RETURNING
+    compiled = _insert_ignoring_duplicates(
+        table(AvailabilitySlot.__tablename__, *(column(name) for name in SLOT_COLUMNS)),
+        connection.dialect
+    ).compile(dialect=connection.dialect)
+    statement = str(compiled)
+    open_flag, closed_flag = _driver_values(connection, "available", [True, False])
+    created_at = _driver_values(connection, "created_at", [datetime.utcnow()])[0]
+
+    rng = random.Random(seed)
+    inserted = 0
+    batch = []
+
+    def flush() -> None:
+        nonlocal inserted
+        params = batch if compiled.positional else [dict(zip(SLOT_COLUMNS, row)) for row in batch]
+        rowcount = connection.exec_driver_sql(statement, params).rowcount
+        # Ignored duplicates are not counted where the driver reports rows written
+        inserted += rowcount if rowcount >= 0 else len(batch)
+        batch.clear()
+
+    for restaurant_id, template in templates.items():
+        open_dates = [
+            day for day in dates
+            if day.weekday() not in template.closed_weekdays
+            and (restaurant_id, day) not in existing
+        ]
+        grid = list(product(
+            _driver_values(connection, "date", open_dates),
+            _driver_values(connection, "time", template.slot_times())
+        ))
+        if availability >= 1:
+            flags = [open_flag] * len(grid)
+        else:
+            flags = rng.choices(
+                (open_flag, closed_flag), cum_weights=(availability, 1), k=len(grid)
+            )
+
+        batch.extend(
+            (restaurant_id, day, slot_time, template.max_party_size, flag, 0, created_at)
+            for (day, slot_time), flag in zip(grid, flags)
+        )
+        if len(batch) >= batch_size:
+            flush()
+
+    if batch:
+        flush()
+    return inserted
 
 
 def init_sample_data() -> None:
@@ -57,34 +304,15 @@ def init_sample_data() -> None:
         db.commit()
         db.refresh(restaurant)
 
-        # Create sample availability slots for the next 30 days
-        sample_times = [
-            time(12, 0),   # 12:00 PM
-            time(12, 30),  # 12:30 PM
-            time(13, 0),   # 1:00 PM
-            time(13, 30),  # 1:30 PM
-            time(19, 0),   # 7:00 PM
-            time(19, 30),  # 7:30 PM
-            time(20, 0),   # 8:00 PM
-            time(20, 30),  # 8:30 PM
-        ]
-
-        start_date = datetime.now().date()
-
-        for i in range(30):  # Next 30 days
-            current_date = start_date + timedelta(days=i)
-            for slot_time in sample_times:
-                # Randomly make some slots unavailable
-                available = random.random() > 0.2  # 80% availability
-
-                slot = AvailabilitySlot(
-                    restaurant_id=restaurant.id,
-                    date=current_date,
-                    time=slot_time,
-                    max_party_size=8,
-                    available=available
-                )
-                db.add(slot)
+        # Create sample availability slots for the next 30 days, randomly
+        # making some slots unavailable (80% availability)
+        generate_slot_schedule(
+            db.connection(),
+            {restaurant.id: DEFAULT_OPENING_HOURS},
+            datetime.now().date(),
+            30,
+            availability=SAMPLE_AVAILABILITY
+        )
 
         # Create sample cancellation reasons
         cancellation_reasons = [
@@ -11,18 +11,26 @@ Version: 1.0.0
 from dotenv import load_dotenv
 load_dotenv()
 
+import asyncio
+from typing import Optional
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.database import engine
-from app.models import Base
 import app.init_db as init_db
+from app import maintenance
+from app.core.cache import availability_cache, tool_cache
+from app.core.config import ENABLE_CHAT, INIT_SAMPLE_DATA, MAINTENANCE_INTERVAL
+from app.core.restaurants import restaurant_directory
 
-# Import routers for different functionalities
-from app.routers import availability, booking, chat
+# Import routers for different functionalities. The chat router is optional
+# so booking-only replicas skip its imports entirely.
+from app.routers import availability, booking
+if ENABLE_CHAT:
+    from app.routers import chat
 
-# Create database tables on startup
-Base.metadata.create_all(bind=engine)
+# Create database tables and apply pending migrations on startup
+init_db.create_tables()
 
 app = FastAPI(
     title="Restaurant Booking Mock API",
@@ -47,7 +55,12 @@ app.add_middleware(
 # Include API routers
 app.include_router(availability.router)
 app.include_router(booking.router)
-app.include_router(chat.router)
+if ENABLE_CHAT:
+    app.include_router(chat.router)
+
+
+# Background task keeping the availability horizon rolling
+maintenance_task: Optional[asyncio.Task] = None
 
 
 @app.on_event("startup")
@@ -56,9 +69,24 @@ async def startup_event() -> None:
     Initialize database with sample data on application startup.
 
     This function is called once when the FastAPI application starts.
-    It ensures the database contains sample restaurant data and availability slots.
+    It ensures the database contains sample restaurant data and availability slots
+    unless disabled with INIT_SAMPLE_DATA=false, loads the restaurant directory,
+    then starts the periodic availability maintenance job unless it is disabled
+    with MAINTENANCE_INTERVAL=0.
     """
-    init_db.init_sample_data()
+    global maintenance_task
+    if INIT_SAMPLE_DATA:
+        init_db.init_sample_data()
+    restaurant_directory.load()
+    if MAINTENANCE_INTERVAL > 0:
+        maintenance_task = asyncio.create_task(maintenance.run_periodically())
+
+
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Stop the availability maintenance job."""
+    if maintenance_task is not None:
+        maintenance_task.cancel()
 
 
 @app.get("/", summary="API Information", tags=["Root"])
@@ -94,8 +122,28 @@ async def root() -> dict:
                 "/api/ConsumerApi/v1/Restaurant/{restaurant_name}/Booking/"
                 "{booking_reference}"
             ),
-            "chat": "/api/chat/",
+            "chat": "/api/chat/" if ENABLE_CHAT else None,
+            "metrics": "/metrics",
             "docs": "/docs",
             "redoc": "/redoc"
         }
     }
+
+
+@app.get("/metrics", summary="Runtime Metrics", tags=["Root"])
+async def metrics() -> dict:
+    """
+    Get in-process runtime counters for monitoring.
+
+    Returns:
+        dict: Availability, LLM and tool cache counters, restaurant directory,
+        chat session, admission and fast-path counters (when chat is enabled),
+        and the outcome of the last availability maintenance run.
+    """
+    return {
+        "availability_cache": availability_cache.stats(),
+        "restaurant_directory": restaurant_directory.stats(),
+        **(chat.chat_stats() if ENABLE_CHAT else {}),
+        "tool_cache": tool_cache.stats(),
+        "maintenance": maintenance.last_run
+    }
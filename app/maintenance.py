@@ -0,0 +1,196 @@
+"""
+Rolling Availability Maintenance.
+
+Keeps the availability horizon materialised a fixed number of days ahead
+and trims history so the hot tables stay small:
+
+- reloads the restaurant directory to pick up restaurants added elsewhere
+- generates slot days that have come into the horizon since the last run
+- marks confirmed bookings from past days as completed
+- purges past availability slots
+- purges completed/cancelled bookings past the retention window (opt-in)
+
+Every purge and status change runs in bounded batches, each in its own
+short transaction, so booking writers never wait behind one long lock.
+The job runs periodically inside the API process (started from
+``app.main``) or on demand from the command line:
+
+    python -m app.maintenance
+
+Author: AI Assistant
+"""
+
+import argparse
+import asyncio
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Table, delete, select, update
+
+from app.core.cache import availability_cache
+from app.core.config import (
+    AVAILABILITY_HORIZON_DAYS, BOOKING_RETENTION_DAYS, MAINTENANCE_BATCH_SIZE,
+    MAINTENANCE_INTERVAL
+)
+from app.core.restaurants import restaurant_directory
+from app.database import engine
+from app.init_db import DEFAULT_OPENING_HOURS, OpeningHours, generate_slot_schedule
+from app.models import AvailabilitySlot, Booking, Restaurant
+
+# Outcome of the most recent run, reported by /metrics
+last_run: Dict[str, Any] = {}
+
+
+def _in_batches(
+    table: Table,
+    where: list,
+    values: Optional[Dict[str, Any]] = None,
+    batch_size: int = MAINTENANCE_BATCH_SIZE
+) -> int:
+    """
+    Delete (or update with ``values``) matching rows a batch at a time.
+
+    Each batch selects at most ``batch_size`` ids and commits on its own, so
+    locks are held only for one small statement. Updated rows must stop
+    matching ``where`` for the loop to make progress.
+
+    Args:
+        table: Table to modify
+        where: Filter criteria selecting the rows
+        values: Column values to set; rows are deleted when omitted
+        batch_size: Rows per transaction
+
+    Returns:
+        int: Number of rows deleted or updated
+    """
+    total = 0
+    while True:
+        ids = select(table.c.id).where(*where).limit(batch_size).scalar_subquery()
+        if values is None:
+            stmt = delete(table).where(table.c.id.in_(ids))
+        else:
+            stmt = update(table).where(table.c.id.in_(ids)).values(**values)
+        with engine.begin() as connection:
+            count = connection.execute(stmt).rowcount
+        total += count
+        if count < batch_size:
+            return total
+
+
+def extend_horizon(
+    today: date,
+    horizon_days: int = AVAILABILITY_HORIZON_DAYS,
+    templates: Optional[Dict[int, OpeningHours]] = None
+) -> int:
+    """
+    Materialise slots for every restaurant up to the horizon.
+
+    Days that already have slots are skipped by the generator, so each run
+    only writes the days that have newly come into range. Each restaurant
+    is generated in its own transaction. New slots are all generated open;
+    closing slots is left to the restaurant.
+
+    Args:
+        today: First day of the horizon
+        horizon_days: Number of days kept materialised
+        templates: Opening hours keyed by restaurant id; restaurants not
+            listed use DEFAULT_OPENING_HOURS
+
+    Returns:
+        int: Number of slots created
+    """
+    with engine.connect() as connection:
+        restaurant_ids = list(connection.execute(select(Restaurant.id)).scalars())
+
+    created = 0
+    dates = [today + timedelta(days=offset) for offset in range(horizon_days)]
+    for restaurant_id in restaurant_ids:
+        with engine.begin() as connection:
+            inserted = generate_slot_schedule(
+                connection,
+                {restaurant_id: (templates or {}).get(restaurant_id, DEFAULT_OPENING_HOURS)},
+                today, horizon_days, availability=1.0
+            )
+        if inserted:
+            # Searches beyond the old horizon were cached as empty
+            availability_cache.invalidate(restaurant_id, *dates)
+        created += inserted
+    return created
+
+
+def run_maintenance(
+    today: Optional[date] = None,
+    horizon_days: int = AVAILABILITY_HORIZON_DAYS,
+    booking_retention_days: Optional[int] = BOOKING_RETENTION_DAYS
+) -> Dict[str, Any]:
+    """
+    Run one maintenance pass.
+
+    Args:
+        today: Reference date, defaults to the current local date
+        horizon_days: Number of days of slots kept materialised
+        booking_retention_days: Days finished bookings are kept after their
+            visit date; None keeps them forever
+
+    Returns:
+        Dict[str, Any]: Counts of slots and bookings created, completed and
+        purged, plus the run timestamp
+    """
+    today = today or datetime.now().date()
+    restaurant_directory.load()
+    bookings = Booking.__table__
+    slots = AvailabilitySlot.__table__
+
+    result = {
+        "slots_created": extend_horizon(today, horizon_days),
+        "bookings_completed": _in_batches(
+            bookings,
+            [bookings.c.status == "confirmed", bookings.c.visit_date < today],
+            values={"status": "completed", "updated_at": datetime.utcnow()}
+        ),
+        "slots_purged": _in_batches(slots, [slots.c.date < today]),
+        "bookings_purged": 0,
+    }
+    if booking_retention_days is not None:
+        result["bookings_purged"] = _in_batches(bookings, [
+            bookings.c.status.in_(("completed", "cancelled")),
+            bookings.c.visit_date < today - timedelta(days=booking_retention_days)
+        ])
+
+    result["finished_at"] = datetime.utcnow()
+    last_run.clear()
+    last_run.update(result)
+    return result
+
+
+async def run_periodically(interval: float = MAINTENANCE_INTERVAL) -> None:
+    """
+    Run maintenance every ``interval`` seconds until cancelled.
+
+    Each pass runs in a worker thread so the event loop keeps serving
+    requests; a failed pass is logged and retried on the next tick.
+
+    Args:
+        interval: Seconds between passes
+    """
+    while True:
+        try:
+            result = await asyncio.to_thread(run_maintenance)
+            print(f"Availability maintenance: {result}")
+        except Exception as e:
+            print(f"Availability maintenance failed: {e}")
+        await asyncio.sleep(interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run one availability maintenance pass.")
+    parser.add_argument("--horizon-days", type=int, default=AVAILABILITY_HORIZON_DAYS)
+    parser.add_argument(
+        "--booking-retention-days", type=int, default=BOOKING_RETENTION_DAYS,
+        help="purge finished bookings this many days after their visit (default: keep)"
+    )
+    args = parser.parse_args()
+    print(run_maintenance(
+        horizon_days=args.horizon_days,
+        booking_retention_days=args.booking_retention_days
+    ))
@@ -12,7 +12,8 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy import (
-    Column, Integer, String, DateTime, Boolean, Date, Time, Text, ForeignKey
+    Column, Integer, String, DateTime, Boolean, Date, Time, Text, ForeignKey,
+    Index, text
 )
 from sqlalchemy.orm import relationship
 
@@ -116,6 +117,26 @@ class Booking(Base):
     """
 
     __tablename__ = "bookings"
+    __table_args__ = (
+        # Availability search filters on restaurant/date/time/status
+        Index(
+            "ix_bookings_restaurant_date_time_status",
+            "restaurant_id", "visit_date", "visit_time", "status"
+        ),
+        # Partial index covering only the confirmed bookings that count
+        # against slot capacity
+        Index(
+            "ix_bookings_confirmed_slot",
+            "restaurant_id", "visit_date", "visit_time",
+            sqlite_where=text("status = 'confirmed'"),
+            postgresql_where=text("status = 'confirmed'")
+        ),
+        # Bookings listing pages in (visit_date, visit_time, id) keyset order
+        Index(
+            "ix_bookings_restaurant_date_time_id",
+            "restaurant_id", "visit_date", "visit_time", "id"
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     booking_reference = Column(String, unique=True, index=True, nullable=False)
@@ -152,10 +173,24 @@ class AvailabilitySlot(Base):
         time (time): Time slot
         max_party_size (int): Maximum party size for this slot
         available (bool): Whether the slot is available for booking
+        confirmed_count (int): Confirmed bookings at this slot, maintained by
+            the booking write paths
         created_at (datetime): Timestamp when slot was created
     """
 
     __tablename__ = "availability_slots"
+    __table_args__ = (
+        Index(
+            "ix_availability_slots_restaurant_date_party",
+            "restaurant_id", "date", "max_party_size"
+        ),
+        # One slot per restaurant, date and time, even when several
+        # maintenance jobs generate the same day concurrently
+        Index(
+            "ux_availability_slots_restaurant_date_time",
+            "restaurant_id", "date", "time", unique=True
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False)
@@ -163,6 +198,7 @@ class AvailabilitySlot(Base):
     time = Column(Time, nullable=False)
     max_party_size = Column(Integer, default=8)
     available = Column(Boolean, default=True)
+    confirmed_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
@@ -187,3 +223,21 @@ class CancellationReason(Base):
     id = Column(Integer, primary_key=True, index=True)
     reason = Column(String, nullable=False)
     description = Column(Text)
+
+
+class SchemaVersion(Base):
+    """
+    Schema version model recording which migrations have been applied.
+
+    One row is written per migration step so existing database files can be
+    upgraded in place by ``app.init_db.upgrade_schema``.
+
+    Attributes:
+        version (int): Migration step number
+        applied_at (datetime): Timestamp when the step was applied
+    """
+
+    __tablename__ = "schema_version"
+
+    version = Column(Integer, primary_key=True)
+    applied_at = Column(DateTime, default=datetime.utcnow)
@@ -7,14 +7,17 @@ including time slot availability checks and booking constraint validation.
 Author: AI Assistant
 """
 
+import json
 from datetime import date
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-from fastapi import APIRouter, Form, Depends, HTTPException, Header
+from fastapi import APIRouter, Form, Depends, HTTPException, Header, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.models import Restaurant, AvailabilitySlot, Booking
+from app.services.booking_service import search_availability, search_availability_range
 
 router = APIRouter(prefix="/api/ConsumerApi/v1/Restaurant", tags=["availability"])
 
@@ -61,7 +64,7 @@ def verify_token(authorization: str = Header(...)) -> str:
     summary="Search Available Time Slots",
     response_description="Available booking slots with availability status"
 )
-async def availability_search(
+def availability_search(
     restaurant_name: str,
     VisitDate: date = Form(..., description="Visit date in YYYY-MM-DD format"),
     PartySize: int = Form(..., description="Number of people in the party"),
@@ -73,8 +76,8 @@ async def availability_search(
     Search for available booking slots at a restaurant.
 
     Retrieves available time slots for a specific restaurant, date, and party size.
-    The system checks base availability slots and current booking counts to determine
-    real-time availability.
+    The system checks base availability slots and their confirmed booking counters
+    to determine real-time availability.
 
     Args:
         restaurant_name: The name of the restaurant
@@ -91,47 +94,62 @@ async def availability_search(
         HTTPException: 404 if restaurant not found
         HTTPException: 401 if authentication fails
     """
-    # Find restaurant by name
-    restaurant = db.query(Restaurant).filter(Restaurant.name == restaurant_name).first()
-    if not restaurant:
-        raise HTTPException(status_code=404, detail="Restaurant not found")
-
-    # Get availability slots for the requested date
-    slots = db.query(AvailabilitySlot).filter(
-        AvailabilitySlot.restaurant_id == restaurant.id,
-        AvailabilitySlot.date == VisitDate,
-        AvailabilitySlot.max_party_size >= PartySize
-    ).all()
-
-    # Check for existing bookings at each slot time
-    available_slots = []
-    for slot in slots:
-        # Count existing bookings for this time slot
-        existing_bookings = db.query(Booking).filter(
-            Booking.restaurant_id == restaurant.id,
-            Booking.visit_date == VisitDate,
-            Booking.visit_time == slot.time,
-            Booking.status == "confirmed"
-        ).count()
-
-        # Simple logic: allow up to 3 bookings per time slot
-        max_bookings_per_slot = 3
-        is_available = slot.available and existing_bookings < max_bookings_per_slot
-
-        available_slots.append({
-            "time": slot.time.strftime("%H:%M:%S"),
-            "available": is_available,
-            "max_party_size": slot.max_party_size,
-            "current_bookings": existing_bookings
-        })
-
-    return {
-        "restaurant": restaurant_name,
-        "restaurant_id": restaurant.id,
-        "visit_date": VisitDate,
-        "party_size": PartySize,
-        "channel_code": ChannelCode,
-        "available_slots": available_slots,
-        "total_slots": len(available_slots)
-    }
+    return search_availability(db, restaurant_name, VisitDate, PartySize, ChannelCode)
 
+
+@router.post(
+    "/{restaurant_name}/AvailabilitySearchRange",
+    summary="Search Available Time Slots Over a Date Range",
+    response_description="Per-day available booking slots for the whole window"
+)
+def availability_search_range(
+    request: Request,
+    restaurant_name: str,
+    VisitDateFrom: date = Form(..., description="First visit date in YYYY-MM-DD format"),
+    VisitDateTo: date = Form(..., description="Last visit date in YYYY-MM-DD format"),
+    PartySize: int = Form(..., description="Number of people in the party"),
+    ChannelCode: str = Form(..., description="Booking channel (e.g., 'ONLINE')"),
+    Weekdays: Optional[str] = Form(
+        None, description="Comma-separated weekdays to include (0=Monday ... 6=Sunday)"
+    ),
+    db: Session = Depends(get_db),
+    token: str = Depends(verify_token)
+):
+    """
+    Search for available booking slots across a window of dates.
+
+    Answers the whole window with a single query instead of one
+    AvailabilitySearch per day. Clients sending
+    ``Accept: application/x-ndjson`` receive one JSON line per day as it is
+    serialised; everyone else gets a single JSON document.
+
+    Args:
+        request: The incoming request, used for content negotiation
+        restaurant_name: The name of the restaurant
+        VisitDateFrom: The first date of the window (inclusive)
+        VisitDateTo: The last date of the window (inclusive)
+        PartySize: Number of people in the party
+        ChannelCode: The booking channel identifier
+        Weekdays: Optional weekday filter
+        db: Database session dependency
+        token: Authentication token dependency
+
+    Returns:
+        Dict containing restaurant info and per-day slots, or an NDJSON stream
+
+    Raises:
+        HTTPException: 400 if the window or weekday filter is invalid
+        HTTPException: 404 if restaurant not found
+        HTTPException: 401 if authentication fails
+    """
+    result = search_availability_range(
+        db, restaurant_name, VisitDateFrom, VisitDateTo, PartySize, ChannelCode, Weekdays
+    )
+
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        return StreamingResponse(
+            (json.dumps(jsonable_encoder(day)) + "\n" for day in result["days"]),
+            media_type="application/x-ndjson"
+        )
+
+    return result
@@ -7,17 +7,32 @@ retrieval, updates, and cancellation of restaurant bookings.
 Author: AI Assistant
 """
 
-import random
-import string
-from datetime import date, time, datetime
-from typing import Optional
-
-from fastapi import APIRouter, Form, HTTPException, Depends, Header
-from pydantic import BaseModel
+import base64
+import csv
+import io
+import json
+from collections import Counter
+from datetime import date, time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from fastapi import APIRouter, Form, HTTPException, Depends, Header, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
+from sqlalchemy import Select, bindparam, insert, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.models import Restaurant, Customer, Booking, CancellationReason
+from app.core.cache import availability_cache
+from app.core.config import BOOKING_IMPORT_MAX_ROWS
+from app.database import SessionLocal, get_db
+from app.models import Customer, Booking, AvailabilitySlot
+from app.services import booking_service
+from app.services.booking_service import (
+    BOOKING_REFERENCE_ATTEMPTS, MAX_BOOKINGS_PER_SLOT, CustomerData,
+    generate_booking_reference, get_restaurant_id
+)
 
 router = APIRouter(prefix="/api/ConsumerApi/v1/Restaurant", tags=["booking"])
 
@@ -59,37 +74,8 @@ def verify_token(authorization: str = Header(...)) -> str:
     return token
 
 
-def generate_booking_reference() -> str:
-    """
-    Generate a unique 7-character alphanumeric booking reference.
-
-    Returns:
-        str: A unique booking reference code
-    """
-    return ''.join(random.choices(string.ascii_uppercase + string.digits, k=7))
-
-
-class CustomerData(BaseModel):
-    Title: Optional[str] = None
-    FirstName: Optional[str] = None
-    Surname: Optional[str] = None
-    MobileCountryCode: Optional[str] = None
-    Mobile: Optional[str] = None
-    PhoneCountryCode: Optional[str] = None
-    Phone: Optional[str] = None
-    Email: Optional[str] = None
-    ReceiveEmailMarketing: Optional[bool] = None
-    ReceiveSmsMarketing: Optional[bool] = None
-    GroupEmailMarketingOptInText: Optional[str] = None
-    GroupSmsMarketingOptInText: Optional[str] = None
-    ReceiveRestaurantEmailMarketing: Optional[bool] = None
-    ReceiveRestaurantSmsMarketing: Optional[bool] = None
-    RestaurantEmailMarketingOptInText: Optional[str] = None
-    RestaurantSmsMarketingOptInText: Optional[str] = None
-
-
 @router.post("/{restaurant_name}/BookingWithStripeToken")
-async def create_booking_with_stripe(
+def create_booking_with_stripe(
     restaurant_name: str,
     VisitDate: date = Form(...),
     VisitTime: time = Form(...),
@@ -137,91 +123,402 @@ async def create_booking_with_stripe(
     """
     Create a new booking with Stripe payment token
     """
-    # Find restaurant
-    restaurant = db.query(Restaurant).filter(Restaurant.name == restaurant_name).first()
-    if not restaurant:
-        raise HTTPException(status_code=404, detail="Restaurant not found")
-
-    # Create or find customer
-    customer = None
-    if Email:
-        customer = db.query(Customer).filter(Customer.email == Email).first()
-
-    if not customer:
-        customer = Customer(
-            title=Title,
-            first_name=FirstName,
-            surname=Surname,
-            mobile_country_code=MobileCountryCode,
-            mobile=Mobile,
-            phone_country_code=PhoneCountryCode,
-            phone=Phone,
-            email=Email,
-            receive_email_marketing=ReceiveEmailMarketing or False,
-            receive_sms_marketing=ReceiveSmsMarketing or False,
-            group_email_marketing_opt_in_text=GroupEmailMarketingOptInText,
-            group_sms_marketing_opt_in_text=GroupSmsMarketingOptInText,
-            receive_restaurant_email_marketing=ReceiveRestaurantEmailMarketing or False,
-            receive_restaurant_sms_marketing=ReceiveRestaurantSmsMarketing or False,
-            restaurant_email_marketing_opt_in_text=RestaurantEmailMarketingOptInText,
-            restaurant_sms_marketing_opt_in_text=RestaurantSmsMarketingOptInText
-        )
-        db.add(customer)
-        db.commit()
-        db.refresh(customer)
-
-    # Generate unique booking reference
-    booking_reference = generate_booking_reference()
-    while db.query(Booking).filter(
-        Booking.booking_reference == booking_reference
-    ).first():
-        booking_reference = generate_booking_reference()
-
-    # Create booking
-    booking = Booking(
-        booking_reference=booking_reference,
-        restaurant_id=restaurant.id,
-        customer_id=customer.id,
-        visit_date=VisitDate,
-        visit_time=VisitTime,
-        party_size=PartySize,
-        channel_code=ChannelCode,
+    customer = CustomerData(
+        Title=Title,
+        FirstName=FirstName,
+        Surname=Surname,
+        MobileCountryCode=MobileCountryCode,
+        Mobile=Mobile,
+        PhoneCountryCode=PhoneCountryCode,
+        Phone=Phone,
+        Email=Email,
+        ReceiveEmailMarketing=ReceiveEmailMarketing,
+        ReceiveSmsMarketing=ReceiveSmsMarketing,
+        GroupEmailMarketingOptInText=GroupEmailMarketingOptInText,
+        GroupSmsMarketingOptInText=GroupSmsMarketingOptInText,
+        ReceiveRestaurantEmailMarketing=ReceiveRestaurantEmailMarketing,
+        ReceiveRestaurantSmsMarketing=ReceiveRestaurantSmsMarketing,
+        RestaurantEmailMarketingOptInText=RestaurantEmailMarketingOptInText,
+        RestaurantSmsMarketingOptInText=RestaurantSmsMarketingOptInText
+    )
+    return booking_service.create_booking(
+        db, restaurant_name, VisitDate, VisitTime, PartySize, ChannelCode,
         special_requests=SpecialRequests,
-        is_leave_time_confirmed=IsLeaveTimeConfirmed or False,
+        is_leave_time_confirmed=IsLeaveTimeConfirmed,
         room_number=RoomNumber,
-        status="confirmed"
+        customer_data=customer
+    )
+
+
+# Values per IN (...) lookup during imports, well under SQLite's bound-parameter limit
+IMPORT_LOOKUP_CHUNK = 500
+
+
+class BookingImportRow(BaseModel):
+    VisitDate: date
+    VisitTime: time
+    PartySize: int
+    ChannelCode: str
+    SpecialRequests: Optional[str] = None
+    IsLeaveTimeConfirmed: Optional[bool] = None
+    RoomNumber: Optional[str] = None
+    Customer: CustomerData = Field(default_factory=CustomerData)
+
+
+def _chunks(values: Iterable[Any], size: int = IMPORT_LOOKUP_CHUNK) -> Iterator[List[Any]]:
+    """Split values into lists of at most ``size`` items."""
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _parse_import_body(body: bytes, content_type: str) -> List[Tuple[Any, Optional[str]]]:
+    """
+    Split an import body into raw rows.
+
+    Args:
+        body: The raw request body
+        content_type: The request's Content-Type header
+
+    Returns:
+        List of (row, error) pairs; error is set for NDJSON lines that are
+        not valid JSON so they can be reported without aborting the batch
+
+    Raises:
+        HTTPException: 400 if a JSON body is not an array of rows
+    """
+    if "ndjson" in content_type:
+        rows = []
+        for line in body.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            try:
+                rows.append((json.loads(line), None))
+            except json.JSONDecodeError as e:
+                rows.append((None, f"Invalid JSON: {e.msg}"))
+        return rows
+
+    try:
+        payload = json.loads(body or b"[]")
+    except json.JSONDecodeError:
+        raise HTTPException(
+            status_code=400,
+            detail="Body must be a JSON array or NDJSON (application/x-ndjson)"
+        )
+    if not isinstance(payload, list):
+        raise HTTPException(status_code=400, detail="Body must be a JSON array of bookings")
+    return [(row, None) for row in payload]
+
+
+def _validation_message(error: ValidationError) -> str:
+    """Flatten a pydantic validation error into a single line."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}"
+        for item in error.errors()
     )
 
-    db.add(booking)
-    db.commit()
-    db.refresh(booking)
 
+def generate_booking_references(db: Session, count: int) -> List[str]:
+    """
+    Generate ``count`` distinct booking references not yet in the database.
+
+    Candidates are checked against existing bookings with one IN query per
+    chunk rather than one lookup per reference.
+
+    Args:
+        db: Database session
+        count: Number of references required
+
+    Returns:
+        List[str]: Unused booking references
+    """
+    references = set()
+    while len(references) < count:
+        candidates = {
+            generate_booking_reference() for _ in range(count - len(references))
+        } - references
+        for chunk in _chunks(candidates):
+            candidates -= set(db.scalars(
+                select(Booking.booking_reference).where(Booking.booking_reference.in_(chunk))
+            ))
+        references |= candidates
+    return list(references)
+
+
+def _claim_slots(db: Session, claimed: Dict[int, int], expected: Dict[int, int]) -> bool:
+    """
+    Add claimed bookings to slot counters in one executemany UPDATE.
+
+    Each row only applies while the slot is open and stays within capacity,
+    so a concurrent booking that took the capacity first makes the claim
+    come up short instead of overselling.
+
+    Args:
+        db: Database session
+        claimed: Bookings to add per slot id
+        expected: Counter value each slot should hold afterwards
+
+    Returns:
+        bool: True if every slot took its full claim
+    """
+    slots = AvailabilitySlot.__table__
+    result = db.execute(
+        update(slots).where(
+            slots.c.id == bindparam("slot_id"),
+            slots.c.available.is_(True),
+            slots.c.confirmed_count + bindparam("claimed") <= MAX_BOOKINGS_PER_SLOT
+        ).values(confirmed_count=slots.c.confirmed_count + bindparam("claimed")),
+        [{"slot_id": slot_id, "claimed": count} for slot_id, count in claimed.items()]
+    )
+    if db.get_bind().dialect.supports_sane_multi_rowcount:
+        return result.rowcount == len(claimed)
+
+    # Drivers that batch executemany cannot report per-row counts; re-read
+    # the counters, which this transaction now holds locked
+    for chunk in _chunks(claimed):
+        for slot_id, confirmed_count in db.execute(
+            select(slots.c.id, slots.c.confirmed_count).where(slots.c.id.in_(chunk))
+        ):
+            if confirmed_count != expected[slot_id]:
+                return False
+    return True
+
+
+def bulk_insert_bookings(
+    db: Session,
+    restaurant_id: int,
+    rows: List[Tuple[int, BookingImportRow]]
+) -> Optional[Dict[int, Dict[str, Any]]]:
+    """
+    Import a batch of validated bookings in one transaction.
+
+    Customers are resolved by email with one IN query per chunk, capacity is
+    checked per slot across the whole batch, and customers, booking rows and
+    slot counters are written with batched statements. Rows whose slot cannot
+    take them fail individually; the rest of the batch still imports.
+
+    Args:
+        db: Database session
+        restaurant_id: The restaurant's primary key
+        rows: (row number, row) pairs to import
+
+    Returns:
+        Optional[Dict[int, Dict[str, Any]]]: Outcome per row number, or None
+        if a concurrent booking changed slot capacity and the batch was
+        rolled back and should be retried
+
+    Raises:
+        IntegrityError: If a booking reference was taken concurrently
+    """
+    results: Dict[int, Dict[str, Any]] = {}
+
+    # Capacity, checked against every slot the batch touches at once
+    slots = {}
+    for chunk in _chunks({row.VisitDate for _, row in rows}):
+        for slot in db.execute(
+            select(
+                AvailabilitySlot.id, AvailabilitySlot.date, AvailabilitySlot.time,
+                AvailabilitySlot.max_party_size, AvailabilitySlot.available,
+                AvailabilitySlot.confirmed_count
+            ).where(
+                AvailabilitySlot.restaurant_id == restaurant_id,
+                AvailabilitySlot.date.in_(chunk)
+            )
+        ):
+            slots[(slot.date, slot.time)] = slot
+
+    claimed = Counter()
+    accepted = []
+    for number, row in rows:
+        slot = slots.get((row.VisitDate, row.VisitTime))
+        if (slot is None or not slot.available
+                or (slot.max_party_size or 0) < row.PartySize
+                or slot.confirmed_count + claimed[slot.id] >= MAX_BOOKINGS_PER_SLOT):
+            results[number] = {
+                "row": number,
+                "status": "failed",
+                "error": "Requested time slot is not available"
+            }
+            continue
+        claimed[slot.id] += 1
+        accepted.append((number, row))
+
+    if not accepted:
+        return results
+
+    expected = {
+        slot.id: slot.confirmed_count + claimed[slot.id]
+        for slot in slots.values() if slot.id in claimed
+    }
+    if not _claim_slots(db, claimed, expected):
+        db.rollback()
+        return None
+
+    # Customers: existing ones by email, new ones inserted in one flush
+    emails = {row.Customer.Email for _, row in accepted if row.Customer.Email}
+    customer_ids = {}
+    for chunk in _chunks(emails):
+        for customer_id, email in db.execute(
+            select(Customer.id, Customer.email).where(Customer.email.in_(chunk))
+        ):
+            customer_ids.setdefault(email, customer_id)
+
+    new_customers = {}
+    for number, row in accepted:
+        data = row.Customer
+        key = data.Email or ("row", number)
+        if key in customer_ids or key in new_customers:
+            continue
+        new_customers[key] = Customer(
+            title=data.Title,
+            first_name=data.FirstName,
+            surname=data.Surname,
+            mobile_country_code=data.MobileCountryCode,
+            mobile=data.Mobile,
+            phone_country_code=data.PhoneCountryCode,
+            phone=data.Phone,
+            email=data.Email,
+            receive_email_marketing=data.ReceiveEmailMarketing or False,
+            receive_sms_marketing=data.ReceiveSmsMarketing or False,
+            group_email_marketing_opt_in_text=data.GroupEmailMarketingOptInText,
+            group_sms_marketing_opt_in_text=data.GroupSmsMarketingOptInText,
+            receive_restaurant_email_marketing=data.ReceiveRestaurantEmailMarketing or False,
+            receive_restaurant_sms_marketing=data.ReceiveRestaurantSmsMarketing or False,
+            restaurant_email_marketing_opt_in_text=data.RestaurantEmailMarketingOptInText,
+            restaurant_sms_marketing_opt_in_text=data.RestaurantSmsMarketingOptInText
+        )
+    db.add_all(new_customers.values())
+    db.flush()
+    customer_ids.update({key: customer.id for key, customer in new_customers.items()})
+
+    # Bookings, one executemany insert
+    references = generate_booking_references(db, len(accepted))
+    bookings = []
+    for (number, row), reference in zip(accepted, references):
+        customer_id = customer_ids[row.Customer.Email or ("row", number)]
+        bookings.append({
+            "booking_reference": reference,
+            "restaurant_id": restaurant_id,
+            "customer_id": customer_id,
+            "visit_date": row.VisitDate,
+            "visit_time": row.VisitTime,
+            "party_size": row.PartySize,
+            "channel_code": row.ChannelCode,
+            "special_requests": row.SpecialRequests,
+            "is_leave_time_confirmed": row.IsLeaveTimeConfirmed or False,
+            "room_number": row.RoomNumber,
+            "status": "confirmed"
+        })
+        results[number] = {
+            "row": number,
+            "status": "imported",
+            "booking_reference": reference,
+            "visit_date": row.VisitDate,
+            "visit_time": row.VisitTime,
+            "customer_id": customer_id
+        }
+    db.execute(insert(Booking), bookings)
+    return results
+
+
+def _import_bookings(
+    db: Session,
+    restaurant_name: str,
+    raw_rows: List[Tuple[Any, Optional[str]]]
+) -> Dict[str, Any]:
+    """Validate and import parsed rows; runs in the threadpool."""
+    restaurant_id = get_restaurant_id(restaurant_name)
+
+    failures = {}
+    rows = []
+    for number, (raw, error) in enumerate(raw_rows):
+        if error is None:
+            try:
+                rows.append((number, BookingImportRow.model_validate(raw)))
+                continue
+            except ValidationError as e:
+                error = _validation_message(e)
+        failures[number] = {"row": number, "status": "failed", "error": error}
+
+    for _ in range(BOOKING_REFERENCE_ATTEMPTS):
+        try:
+            results = bulk_insert_bookings(db, restaurant_id, rows) if rows else {}
+            if results is None:
+                continue
+            db.commit()
+            break
+        except IntegrityError:
+            db.rollback()
+    else:
+        raise HTTPException(
+            status_code=500,
+            detail="Could not import the batch; retry the request"
+        )
+
+    results.update(failures)
+    imported_dates = {
+        result["visit_date"] for result in results.values() if result["status"] == "imported"
+    }
+    if imported_dates:
+        availability_cache.invalidate(restaurant_id, *imported_dates)
+
+    imported = sum(1 for result in results.values() if result["status"] == "imported")
     return {
-        "booking_reference": booking_reference,
-        "booking_id": booking.id,
         "restaurant": restaurant_name,
-        "visit_date": VisitDate,
-        "visit_time": VisitTime,
-        "party_size": PartySize,
-        "channel_code": ChannelCode,
-        "special_requests": SpecialRequests,
-        "is_leave_time_confirmed": IsLeaveTimeConfirmed,
-        "room_number": RoomNumber,
-        "customer": {
-            "id": customer.id,
-            "title": customer.title,
-            "first_name": customer.first_name,
-            "surname": customer.surname,
-            "email": customer.email,
-            "mobile": customer.mobile
-        },
-        "status": "confirmed",
-        "created_at": booking.created_at
+        "total": len(raw_rows),
+        "imported": imported,
+        "failed": len(raw_rows) - imported,
+        "results": [results[number] for number in range(len(raw_rows))]
     }
 
 
+@router.post(
+    "/{restaurant_name}/BookingImport",
+    summary="Bulk Import Bookings",
+    response_description="Per-row import results"
+)
+async def import_bookings(
+    request: Request,
+    restaurant_name: str,
+    db: Session = Depends(get_db),
+    token: str = Depends(verify_token)
+):
+    """
+    Import many bookings in one request.
+
+    The body is either a JSON array of bookings or, with
+    ``Content-Type: application/x-ndjson``, one booking per line. Each
+    booking uses the BookingWithStripeToken field names with customer
+    details nested under ``Customer``. Rows are validated and imported
+    individually: a malformed row or a full slot fails that row only.
+
+    Args:
+        request: The incoming request carrying the raw body
+        restaurant_name: The name of the restaurant
+        db: Database session dependency
+        token: Authentication token dependency
+
+    Returns:
+        Dict with imported/failed counts and one result per input row
+
+    Raises:
+        HTTPException: 400 if the body is not a JSON array/NDJSON or too large
+        HTTPException: 404 if restaurant not found
+        HTTPException: 401 if authentication fails
+    """
+    raw_rows = _parse_import_body(await request.body(), request.headers.get("content-type", ""))
+    if len(raw_rows) > BOOKING_IMPORT_MAX_ROWS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Import cannot exceed {BOOKING_IMPORT_MAX_ROWS} bookings per request"
+        )
+
+    # The import itself is blocking database work; keep it off the event loop
+    return await run_in_threadpool(_import_bookings, db, restaurant_name, raw_rows)
+
+
 @router.post("/{restaurant_name}/Booking/{booking_reference}/Cancel")
-async def cancel_booking(
+def cancel_booking(
     restaurant_name: str,
     booking_reference: str,
     micrositeName: str = Form(...),
@@ -237,53 +534,14 @@ async def cancel_booking(
     if booking_reference != bookingReference:
         raise HTTPException(status_code=400, detail="Booking reference mismatch")
 
-    # Find restaurant
-    restaurant = db.query(Restaurant).filter(Restaurant.name == restaurant_name).first()
-    if not restaurant:
-        raise HTTPException(status_code=404, detail="Restaurant not found")
-
-    # Find booking
-    booking = db.query(Booking).filter(
-        Booking.booking_reference == booking_reference,
-        Booking.restaurant_id == restaurant.id
-    ).first()
-    if not booking:
-        raise HTTPException(status_code=404, detail="Booking not found")
-
-    # Check if already cancelled
-    if booking.status == "cancelled":
-        raise HTTPException(status_code=400, detail="Booking is already cancelled")
-
-    # Validate cancellation reason
-    cancellation_reason = db.query(CancellationReason).filter(
-        CancellationReason.id == cancellationReasonId
-    ).first()
-    if not cancellation_reason:
-        raise HTTPException(status_code=400, detail="Invalid cancellation reason")
-
-    # Update booking status
-    booking.status = "cancelled"
-    booking.cancellation_reason_id = cancellationReasonId
-    booking.updated_at = datetime.utcnow()
-
-    db.commit()
-    db.refresh(booking)
-
-    return {
-        "booking_reference": booking_reference,
-        "booking_id": booking.id,
-        "restaurant": restaurant_name,
-        "microsite_name": micrositeName,
-        "cancellation_reason_id": cancellationReasonId,
-        "cancellation_reason": cancellation_reason.reason,
-        "status": "cancelled",
-        "cancelled_at": booking.updated_at,
-        "message": f"Booking {booking_reference} has been successfully cancelled"
-    }
+    return booking_service.cancel_booking(
+        db, restaurant_name, booking_reference, cancellationReasonId,
+        microsite_name=micrositeName
+    )
 
 
 @router.get("/{restaurant_name}/Booking/{booking_reference}")
-async def get_booking(
+def get_booking(
     restaurant_name: str,
     booking_reference: str,
     db: Session = Depends(get_db),
@@ -292,61 +550,11 @@ async def get_booking(
     """
     Get booking details by reference
     """
-    # Find restaurant
-    restaurant = db.query(Restaurant).filter(Restaurant.name == restaurant_name).first()
-    if not restaurant:
-        raise HTTPException(status_code=404, detail="Restaurant not found")
-
-    # Find booking with customer data
-    booking = db.query(Booking).filter(
-        Booking.booking_reference == booking_reference,
-        Booking.restaurant_id == restaurant.id
-    ).first()
-    if not booking:
-        raise HTTPException(status_code=404, detail="Booking not found")
-
-    # Get cancellation reason if cancelled
-    cancellation_reason = None
-    if booking.status == "cancelled" and booking.cancellation_reason_id:
-        reason = db.query(CancellationReason).filter(
-            CancellationReason.id == booking.cancellation_reason_id
-        ).first()
-        if reason:
-            cancellation_reason = {
-                "id": reason.id,
-                "reason": reason.reason,
-                "description": reason.description
-            }
-
-    return {
-        "booking_reference": booking_reference,
-        "booking_id": booking.id,
-        "restaurant": restaurant_name,
-        "visit_date": booking.visit_date,
-        "visit_time": booking.visit_time,
-        "party_size": booking.party_size,
-        "channel_code": booking.channel_code,
-        "special_requests": booking.special_requests,
-        "is_leave_time_confirmed": booking.is_leave_time_confirmed,
-        "room_number": booking.room_number,
-        "status": booking.status,
-        "customer": {
-            "id": booking.customer.id,
-            "title": booking.customer.title,
-            "first_name": booking.customer.first_name,
-            "surname": booking.customer.surname,
-            "email": booking.customer.email,
-            "mobile": booking.customer.mobile,
-            "phone": booking.customer.phone
-        },
-        "cancellation_reason": cancellation_reason,
-        "created_at": booking.created_at,
-        "updated_at": booking.updated_at
-    }
+    return booking_service.get_booking(db, restaurant_name, booking_reference)
 
 
 @router.patch("/{restaurant_name}/Booking/{booking_reference}")
-async def update_booking(
+def update_booking(
     restaurant_name: str,
     booking_reference: str,
     VisitDate: Optional[date] = Form(None),
@@ -360,67 +568,263 @@ async def update_booking(
     """
     Update an existing booking
     """
-    # Find restaurant
-    restaurant = db.query(Restaurant).filter(Restaurant.name == restaurant_name).first()
-    if not restaurant:
-        raise HTTPException(status_code=404, detail="Restaurant not found")
-
-    # Find booking
-    booking = db.query(Booking).filter(
-        Booking.booking_reference == booking_reference,
-        Booking.restaurant_id == restaurant.id
-    ).first()
-    if not booking:
-        raise HTTPException(status_code=404, detail="Booking not found")
-
-    # Check if booking can be updated
-    if booking.status == "cancelled":
-        raise HTTPException(status_code=400, detail="Cannot update cancelled booking")
-
-    # Track updates
-    updates = {}
-    updated = False
-
-    if VisitDate is not None and VisitDate != booking.visit_date:
-        booking.visit_date = VisitDate
-        updates["visit_date"] = VisitDate
-        updated = True
-
-    if VisitTime is not None and VisitTime != booking.visit_time:
-        booking.visit_time = VisitTime
-        updates["visit_time"] = VisitTime
-        updated = True
-
-    if PartySize is not None and PartySize != booking.party_size:
-        booking.party_size = PartySize
-        updates["party_size"] = PartySize
-        updated = True
-
-    if SpecialRequests is not None and SpecialRequests != booking.special_requests:
-        booking.special_requests = SpecialRequests
-        updates["special_requests"] = SpecialRequests
-        updated = True
-
-    if (IsLeaveTimeConfirmed is not None and
-            IsLeaveTimeConfirmed != booking.is_leave_time_confirmed):
-        booking.is_leave_time_confirmed = IsLeaveTimeConfirmed
-        updates["is_leave_time_confirmed"] = IsLeaveTimeConfirmed
-        updated = True
-
-    if updated:
-        booking.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(booking)
+    return booking_service.update_booking(
+        db, restaurant_name, booking_reference,
+        visit_date=VisitDate,
+        visit_time=VisitTime,
+        party_size=PartySize,
+        special_requests=SpecialRequests,
+        is_leave_time_confirmed=IsLeaveTimeConfirmed
+    )
+
+
+# Page size bounds for the bookings listing
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Rows fetched per round trip while streaming an export
+EXPORT_BATCH_SIZE = 1000
+
+# Columns of a listed/exported booking, in CSV order
+EXPORT_COLUMNS = (
+    "booking_reference", "booking_id", "visit_date", "visit_time", "party_size",
+    "channel_code", "status", "special_requests", "is_leave_time_confirmed",
+    "room_number", "customer_id", "customer_first_name", "customer_surname",
+    "customer_email", "customer_mobile", "created_at", "updated_at"
+)
+
+
+def _bookings_query(
+    restaurant_id: int,
+    date_from: Optional[date],
+    date_to: Optional[date],
+    status: Optional[str],
+    channel_code: Optional[str]
+) -> Select:
+    """
+    Build the filtered bookings query in keyset order.
+
+    Selects plain columns rather than ORM entities so large result sets are
+    never turned into identity-mapped objects.
+
+    Args:
+        restaurant_id: The restaurant's primary key
+        date_from: First visit date to include
+        date_to: Last visit date to include
+        status: Booking status to match
+        channel_code: Booking channel to match
+
+    Returns:
+        Select: Query ordered by (visit_date, visit_time, id)
+    """
+    stmt = select(
+        Booking.booking_reference,
+        Booking.id.label("booking_id"),
+        Booking.visit_date,
+        Booking.visit_time,
+        Booking.party_size,
+        Booking.channel_code,
+        Booking.status,
+        Booking.special_requests,
+        Booking.is_leave_time_confirmed,
+        Booking.room_number,
+        Customer.id.label("customer_id"),
+        Customer.first_name.label("customer_first_name"),
+        Customer.surname.label("customer_surname"),
+        Customer.email.label("customer_email"),
+        Customer.mobile.label("customer_mobile"),
+        Booking.created_at,
+        Booking.updated_at
+    ).join(Customer, Booking.customer_id == Customer.id).where(
+        Booking.restaurant_id == restaurant_id
+    )
+    if date_from is not None:
+        stmt = stmt.where(Booking.visit_date >= date_from)
+    if date_to is not None:
+        stmt = stmt.where(Booking.visit_date <= date_to)
+    if status is not None:
+        stmt = stmt.where(Booking.status == status)
+    if channel_code is not None:
+        stmt = stmt.where(Booking.channel_code == channel_code)
+    return stmt.order_by(Booking.visit_date, Booking.visit_time, Booking.id)
+
+
+def _encode_cursor(visit_date: date, visit_time: time, booking_id: int) -> str:
+    """Encode a keyset position as an opaque URL-safe token."""
+    raw = json.dumps([visit_date.isoformat(), visit_time.isoformat(), booking_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[date, time, int]:
+    """
+    Decode a cursor produced by ``_encode_cursor``.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        visit_date, visit_time, booking_id = json.loads(raw)
+        return date.fromisoformat(visit_date), time.fromisoformat(visit_time), int(booking_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _check_date_range(date_from: Optional[date], date_to: Optional[date]) -> None:
+    """Reject windows that end before they start."""
+    if date_from is not None and date_to is not None and date_to < date_from:
+        raise HTTPException(status_code=400, detail="VisitDateTo is before VisitDateFrom")
+
+
+@router.get(
+    "/{restaurant_name}/Bookings",
+    summary="List Bookings",
+    response_description="One page of bookings and the cursor for the next page"
+)
+def list_bookings(
+    restaurant_name: str,
+    VisitDateFrom: Optional[date] = Query(None, description="First visit date to include"),
+    VisitDateTo: Optional[date] = Query(None, description="Last visit date to include"),
+    Status: Optional[str] = Query(None, description="confirmed, cancelled or completed"),
+    ChannelCode: Optional[str] = Query(None, description="Booking channel to match"),
+    Limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    Cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db: Session = Depends(get_db),
+    token: str = Depends(verify_token)
+):
+    """
+    List a restaurant's bookings in visit order, one page at a time.
+
+    Pages are addressed with a keyset cursor on (visit_date, visit_time, id)
+    rather than an offset, so every page costs the same index range scan no
+    matter how deep into the history it is.
+
+    Args:
+        restaurant_name: The name of the restaurant
+        VisitDateFrom: Optional first visit date (inclusive)
+        VisitDateTo: Optional last visit date (inclusive)
+        Status: Optional booking status filter
+        ChannelCode: Optional booking channel filter
+        Limit: Page size
+        Cursor: Opaque position returned as next_cursor by the previous page
+        db: Database session dependency
+        token: Authentication token dependency
+
+    Returns:
+        Dict with the page of bookings and next_cursor (None on the last page)
+
+    Raises:
+        HTTPException: 400 if the date window or cursor is invalid
+        HTTPException: 404 if restaurant not found
+        HTTPException: 401 if authentication fails
+    """
+    _check_date_range(VisitDateFrom, VisitDateTo)
+
+    restaurant_id = get_restaurant_id(restaurant_name)
+
+    stmt = _bookings_query(restaurant_id, VisitDateFrom, VisitDateTo, Status, ChannelCode)
+    if Cursor:
+        stmt = stmt.where(
+            tuple_(Booking.visit_date, Booking.visit_time, Booking.id) > _decode_cursor(Cursor)
+        )
+
+    # Fetch one extra row to learn whether another page follows
+    rows = db.execute(stmt.limit(Limit + 1)).all()
+    page = rows[:Limit]
+    next_cursor = None
+    if len(rows) > Limit:
+        last = page[-1]
+        next_cursor = _encode_cursor(last.visit_date, last.visit_time, last.booking_id)
 
     return {
-        "booking_reference": booking_reference,
-        "booking_id": booking.id,
         "restaurant": restaurant_name,
-        "updates": updates,
-        "status": "updated" if updated else "no_changes",
-        "updated_at": booking.updated_at,
-        "message": (
-            f"Booking {booking_reference} has been "
-            f"{'successfully updated' if updated else 'checked - no changes made'}"
-        )
+        "bookings": [row._asdict() for row in page],
+        "count": len(page),
+        "next_cursor": next_cursor
     }
+
+
+def _stream_bookings(stmt: Select, export_format: str) -> Iterator[str]:
+    """
+    Yield an export as NDJSON lines or CSV chunks.
+
+    Uses its own session so the cursor outlives the request's dependency
+    scope, and streams rows in batches through a server-side cursor so
+    memory stays flat regardless of the export size.
+
+    Args:
+        stmt: The bookings query to export
+        export_format: "ndjson" or "csv"
+
+    Yields:
+        str: Encoded chunks of the export
+    """
+    with SessionLocal() as db:
+        result = db.execute(
+            stmt.execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE)
+        )
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(EXPORT_COLUMNS)
+            for partition in result.partitions():
+                writer.writerows(partition)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            yield buffer.getvalue()
+        else:
+            for partition in result.partitions():
+                yield "".join(
+                    json.dumps(jsonable_encoder(row._asdict())) + "\n" for row in partition
+                )
+
+
+@router.get(
+    "/{restaurant_name}/Bookings/Export",
+    summary="Export Bookings",
+    response_description="All matching bookings as NDJSON or CSV"
+)
+def export_bookings(
+    restaurant_name: str,
+    VisitDateFrom: Optional[date] = Query(None, description="First visit date to include"),
+    VisitDateTo: Optional[date] = Query(None, description="Last visit date to include"),
+    Status: Optional[str] = Query(None, description="confirmed, cancelled or completed"),
+    ChannelCode: Optional[str] = Query(None, description="Booking channel to match"),
+    Format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    db: Session = Depends(get_db),
+    token: str = Depends(verify_token)
+):
+    """
+    Stream every matching booking in visit order.
+
+    Args:
+        restaurant_name: The name of the restaurant
+        VisitDateFrom: Optional first visit date (inclusive)
+        VisitDateTo: Optional last visit date (inclusive)
+        Status: Optional booking status filter
+        ChannelCode: Optional booking channel filter
+        Format: "ndjson" (default) or "csv"
+        db: Database session dependency
+        token: Authentication token dependency
+
+    Returns:
+        StreamingResponse: The export, written as rows are read
+
+    Raises:
+        HTTPException: 400 if the date window is invalid
+        HTTPException: 404 if restaurant not found
+        HTTPException: 401 if authentication fails
+    """
+    _check_date_range(VisitDateFrom, VisitDateTo)
+
+    restaurant_id = get_restaurant_id(restaurant_name)
+
+    stmt = _bookings_query(restaurant_id, VisitDateFrom, VisitDateTo, Status, ChannelCode)
+    if Format == "csv":
+        return StreamingResponse(
+            _stream_bookings(stmt, "csv"),
+            media_type="text/csv",
+            headers={"Content-Disposition": f'attachment; filename="{restaurant_name}-bookings.csv"'}
+        )
+    return StreamingResponse(_stream_bookings(stmt, "ndjson"), media_type="application/x-ndjson")
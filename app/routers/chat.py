@@ -1,29 +1,195 @@
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+import asyncio
+import json
+import time
+import uuid
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional, Tuple
 
-from app.agents.agent import get_agent
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 
-from app.utils.nlp import (
-    parse_input,
-    normalize_date,
-    normalize_time,
-    normalize_party_size,
+from app.agents.sessions import chat_sessions
+from app.core.config import (
+    RESTAURANT_NAME, CHAT_MAX_CONCURRENCY, CHAT_MAX_QUEUED, CHAT_QUEUE_TIMEOUT, CHAT_FAST_PATH
 )
+from app.core.limiter import ConcurrencyLimiter, Overloaded
+from app.core.restaurants import restaurant_directory
+
+if TYPE_CHECKING:
+    from app.agents.intents import Intent
+    from app.agents.sessions import ChatSession
 
 router = APIRouter(prefix="/api/chat", tags=["chat"])
 
+# Bounds concurrent agent turns so chat bursts cannot starve the booking API
+chat_limiter = ConcurrencyLimiter(CHAT_MAX_CONCURRENCY, CHAT_MAX_QUEUED, CHAT_QUEUE_TIMEOUT)
+
+@lru_cache(maxsize=1)
+def _agents() -> SimpleNamespace:
+    # LangChain, the agent tools and their HTTP client take seconds to import,
+    # so they are only loaded once the first chat request arrives
+    from app.agents.agent import get_agent
+    from app.agents.intents import intent_metrics, match_intent
+    from app.agents.llm import llm_cache
+    from app.agents.streaming import StreamingHandler
+    return SimpleNamespace(
+        get_agent=get_agent,
+        intent_metrics=intent_metrics,
+        match_intent=match_intent,
+        llm_cache=llm_cache,
+        StreamingHandler=StreamingHandler,
+    )
+
+async def _load_agents() -> SimpleNamespace:
+    """Return the agent stack, importing it in a worker thread on first use."""
+    if _agents.cache_info().currsize:
+        return _agents()
+    return await asyncio.to_thread(_agents)
+
+def chat_stats() -> Dict[str, Any]:
+    """
+    Chat counters for /metrics.
+
+    Returns:
+        dict: Session, admission, fast-path and LLM cache counters; the
+        last two are None until the agent stack has been loaded.
+    """
+    agents = _agents() if _agents.cache_info().currsize else None
+    llm_cache = agents.llm_cache if agents else None
+    return {
+        "chat_sessions": chat_sessions.stats(),
+        "chat_limiter": chat_limiter.stats(),
+        "chat_fast_path": agents.intent_metrics.stats() if agents else None,
+        "llm_cache": llm_cache.stats() if llm_cache is not None else None,
+    }
+
 class ChatRequest(BaseModel):
     message: str
+    restaurant: Optional[str] = None  # defaults to RESTAURANT_NAME
+    session_id: Optional[str] = Field(None, max_length=128)  # omit to start a conversation
 
 class ChatResponse(BaseModel):
     reply: str
+    session_id: Optional[str] = None  # send back to continue the conversation
 
-@router.post("/", response_model=ChatResponse)
-def chat_endpoint(req: ChatRequest):
+async def _fast_path_turn(
+    agents: SimpleNamespace, req: ChatRequest, restaurant: str, intent: "Intent"
+) -> Tuple[str, Optional[str]]:
+    started = time.perf_counter()
+    reply = await asyncio.to_thread(intent.tool, intent.tool_input, restaurant=restaurant)
+    agents.intent_metrics.record_fast_path(intent.name, time.perf_counter() - started)
+
+    # Record the exchange so the agent can follow up on it in later turns.
+    # Only the session's memory is touched, never its agent or LLM, and the
+    # tool has already acted, so a failure here must not lose its reply.
+    session_id = req.session_id or uuid.uuid4().hex
+    try:
+        session_id, session = agents.get_agent(session_id, restaurant)
+        async with session.lock:
+            session.memory.save_context({"input": req.message}, {"output": reply})
+    except Exception:
+        pass
+    return reply, session_id
+
+async def _session_agent(session: "ChatSession") -> Any:
+    """The session's agent; building it constructs the LLM client, so off the loop."""
+    return await asyncio.to_thread(getattr, session, "agent")
+
+async def _agent_turn(
+    agents: SimpleNamespace, req: ChatRequest, restaurant: str
+) -> Tuple[str, Optional[str]]:
+    session_id, session = agents.get_agent(req.session_id, restaurant)
+    async with session.lock:
+        agent = await _session_agent(session)
+        started = time.perf_counter()
+        reply = await agent.arun(req.message)
+    agents.intent_metrics.record_agent(time.perf_counter() - started)
+    return reply, session_id
+
+async def _check_request(req: ChatRequest) -> str:
     if not req.message.strip():
         raise HTTPException(400, "Empty message")
+    restaurant = req.restaurant or RESTAURANT_NAME
+    # An unknown name may reload the directory from the database
+    if await asyncio.to_thread(restaurant_directory.resolve, restaurant) is None:
+        raise HTTPException(404, "Restaurant not found")
+    return restaurant
+
+@router.post("/", response_model=ChatResponse)
+async def chat_endpoint(req: ChatRequest):
+    restaurant = await _check_request(req)
+    agents = await _load_agents()
+
+    # Fully specified requests skip the LLM (and its admission queue) entirely
+    intent = agents.match_intent(req.message) if CHAT_FAST_PATH else None
+    session_id = req.session_id
+    try:
+        if intent is not None:
+            reply, session_id = await _fast_path_turn(agents, req, restaurant, intent)
+        else:
+            async with chat_limiter.slot():
+                reply, session_id = await _agent_turn(agents, req, restaurant)
+    except Overloaded as e:
+        raise HTTPException(
+            429, str(e), headers={"Retry-After": str(max(1, round(CHAT_QUEUE_TIMEOUT)))}
+        )
+    except Exception:
+        reply = "Oops, something went wrong. Please try again later."
+    return ChatResponse(reply=reply, session_id=session_id)
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+async def _stream_turn(
+    agents: SimpleNamespace, req: ChatRequest, restaurant: str, intent: Optional["Intent"]
+) -> AsyncIterator[str]:
+    yield _sse("start", {"fast_path": intent is not None})
+    session_id = req.session_id
     try:
-        reply = get_agent().run(req.message)
+        if intent is not None:
+            yield _sse("tool", {"name": intent.name, "input": intent.tool_input})
+            reply, session_id = await _fast_path_turn(agents, req, restaurant, intent)
+        else:
+            async with chat_limiter.slot():
+                session_id, session = agents.get_agent(req.session_id, restaurant)
+                handler = agents.StreamingHandler()
+                async with session.lock:
+                    agent = await _session_agent(session)
+                    started = time.perf_counter()
+                    run = asyncio.create_task(agent.arun(req.message, callbacks=[handler]))
+                    try:
+                        async for event, data in handler.events(run):
+                            yield _sse(event, data)
+                        reply = await run
+                    finally:
+                        # The client went away mid-answer
+                        if not run.done():
+                            run.cancel()
+                agents.intent_metrics.record_agent(time.perf_counter() - started)
+    except Overloaded as e:
+        # Headers are already sent, so back-pressure is reported in-band
+        yield _sse("error", {"status": 429, "detail": str(e)})
+        return
     except Exception:
         reply = "Oops, something went wrong. Please try again later."
-    return ChatResponse(reply=reply)
+    yield _sse("done", {"reply": reply, "session_id": session_id})
+
+@router.post("/stream")
+async def chat_stream_endpoint(req: ChatRequest):
+    """
+    Chat turn streamed as Server-Sent Events.
+
+    Emits ``start`` at once, ``tool``/``tool_end`` as the agent calls tools,
+    ``token`` for each piece of the final answer as the model produces it,
+    and ``done`` with the full reply and session id (or ``error``).
+    """
+    restaurant = await _check_request(req)
+    agents = await _load_agents()
+    intent = agents.match_intent(req.message) if CHAT_FAST_PATH else None
+    return StreamingResponse(
+        _stream_turn(agents, req, restaurant, intent),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,768 @@
+"""
+Booking Service.
+
+The restaurant booking API's business logic: availability searches,
+booking creation, lookup, updates and cancellation, plus the slot
+capacity helpers they share. The routers translate HTTP requests into
+calls to these functions, and the chat agent's in-process transport
+(API_TRANSPORT=local) calls them directly, so both go through the same
+validation and capacity rules. Errors are raised as HTTPException.
+
+Author: AI Assistant
+"""
+
+import random
+import string
+from datetime import date, datetime, time, timedelta
+from itertools import groupby
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.cache import availability_cache
+from app.core.restaurants import restaurant_directory
+from app.models import AvailabilitySlot, Booking, CancellationReason, Customer
+
+# Simple capacity rule: allow up to 3 confirmed bookings per time slot
+MAX_BOOKINGS_PER_SLOT = 3
+
+# Longest window a single range search may cover
+MAX_RANGE_DAYS = 92
+
+
+def get_restaurant_id(restaurant_name: str) -> int:
+    """
+    Resolve a restaurant name or microsite name to its id.
+
+    Lookups go through the in-memory restaurant directory rather than
+    querying the restaurants table on every request.
+
+    Args:
+        restaurant_name: The restaurant's name or microsite name
+
+    Returns:
+        int: The restaurant's primary key
+
+    Raises:
+        HTTPException: 404 if no restaurant matches
+    """
+    restaurant_id = restaurant_directory.resolve(restaurant_name)
+    if restaurant_id is None:
+        raise HTTPException(status_code=404, detail="Restaurant not found")
+    return restaurant_id
+
+
+def search_slots(
+    db: Session,
+    restaurant_id: int,
+    visit_date: date,
+    party_size: int
+) -> List[Dict[str, Any]]:
+    """
+    Compute slot availability for one restaurant and date.
+
+    Each slot carries a confirmed_count maintained by the booking write
+    paths, so this is a single indexed read of the day's slots.
+
+    Args:
+        db: Database session
+        restaurant_id: The restaurant's primary key
+        visit_date: The date to search
+        party_size: Number of people in the party
+
+    Returns:
+        List of slot dicts ordered by time
+    """
+    rows = db.query(
+        AvailabilitySlot.time,
+        AvailabilitySlot.max_party_size,
+        AvailabilitySlot.available,
+        AvailabilitySlot.confirmed_count
+    ).filter(
+        AvailabilitySlot.restaurant_id == restaurant_id,
+        AvailabilitySlot.date == visit_date,
+        AvailabilitySlot.max_party_size >= party_size
+    ).order_by(AvailabilitySlot.time).all()
+
+    return [_slot_entry(*row) for row in rows]
+
+
+def search_slots_range(
+    db: Session,
+    restaurant_id: int,
+    visit_dates: List[date],
+    party_size: int
+) -> List[Dict[str, Any]]:
+    """
+    Compute slot availability for several dates with one indexed range read.
+
+    Args:
+        db: Database session
+        restaurant_id: The restaurant's primary key
+        visit_dates: Dates to search, in ascending order
+        party_size: Number of people in the party
+
+    Returns:
+        One dict per requested date with its slots ordered by time
+    """
+    if not visit_dates:
+        return []
+
+    rows = db.query(
+        AvailabilitySlot.date,
+        AvailabilitySlot.time,
+        AvailabilitySlot.max_party_size,
+        AvailabilitySlot.available,
+        AvailabilitySlot.confirmed_count
+    ).filter(
+        AvailabilitySlot.restaurant_id == restaurant_id,
+        AvailabilitySlot.date.between(visit_dates[0], visit_dates[-1]),
+        AvailabilitySlot.date.in_(visit_dates),
+        AvailabilitySlot.max_party_size >= party_size
+    ).order_by(AvailabilitySlot.date, AvailabilitySlot.time).all()
+
+    slots_by_date = {
+        slot_date: [_slot_entry(*row[1:]) for row in day_rows]
+        for slot_date, day_rows in groupby(rows, key=lambda row: row[0])
+    }
+    return [
+        {
+            "visit_date": visit_date,
+            "available_slots": slots_by_date.get(visit_date, []),
+            "total_slots": len(slots_by_date.get(visit_date, []))
+        }
+        for visit_date in visit_dates
+    ]
+
+
+def _slot_entry(slot_time, max_party_size, available, confirmed_count) -> Dict[str, Any]:
+    """Build the response entry for a single slot row."""
+    return {
+        "time": slot_time.strftime("%H:%M:%S"),
+        "available": bool(available) and confirmed_count < MAX_BOOKINGS_PER_SLOT,
+        "max_party_size": max_party_size,
+        "current_bookings": confirmed_count
+    }
+
+
+def parse_weekdays(weekdays: Optional[str]) -> Optional[set]:
+    """Parse a comma-separated list of weekday numbers (0=Monday ... 6=Sunday)."""
+    if not weekdays:
+        return None
+    try:
+        parsed = {int(part) for part in weekdays.split(",") if part.strip()}
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid weekday filter")
+    if not parsed or not parsed <= set(range(7)):
+        raise HTTPException(status_code=400, detail="Invalid weekday filter")
+    return parsed
+
+
+# Attempts at a booking unit of work before giving up on reference collisions
+BOOKING_REFERENCE_ATTEMPTS = 5
+
+
+def generate_booking_reference() -> str:
+    """
+    Generate a unique 7-character alphanumeric booking reference.
+
+    Returns:
+        str: A unique booking reference code
+    """
+    return ''.join(random.choices(string.ascii_uppercase + string.digits, k=7))
+
+
+def reserve_slot(
+    db: Session,
+    restaurant_id: int,
+    visit_date: date,
+    visit_time: time,
+    party_size: int
+) -> bool:
+    """
+    Atomically claim one booking's worth of capacity on a slot.
+
+    The capacity check and the increment are a single conditional UPDATE,
+    so concurrent requests cannot both pass the check and oversell the slot:
+    the database serialises writers on the row and re-evaluates the WHERE
+    clause for each. The change commits (or rolls back) with the caller's
+    transaction.
+
+    Args:
+        db: Database session
+        restaurant_id: The restaurant's primary key
+        visit_date: Date of the slot
+        visit_time: Time of the slot
+        party_size: Number of people in the party
+
+    Returns:
+        bool: True if the slot was reserved, False if it is missing, closed,
+        too small for the party or already full
+    """
+    result = db.execute(
+        update(AvailabilitySlot).where(
+            AvailabilitySlot.restaurant_id == restaurant_id,
+            AvailabilitySlot.date == visit_date,
+            AvailabilitySlot.time == visit_time,
+            AvailabilitySlot.available.is_(True),
+            AvailabilitySlot.max_party_size >= party_size,
+            AvailabilitySlot.confirmed_count < MAX_BOOKINGS_PER_SLOT
+        ).values(confirmed_count=AvailabilitySlot.confirmed_count + 1)
+    )
+    return result.rowcount == 1
+
+
+def release_slot(
+    db: Session,
+    restaurant_id: int,
+    visit_date: date,
+    visit_time: time
+) -> None:
+    """
+    Atomically give back one booking's worth of capacity on a slot.
+
+    Args:
+        db: Database session
+        restaurant_id: The restaurant's primary key
+        visit_date: Date of the slot
+        visit_time: Time of the slot
+    """
+    db.execute(
+        update(AvailabilitySlot).where(
+            AvailabilitySlot.restaurant_id == restaurant_id,
+            AvailabilitySlot.date == visit_date,
+            AvailabilitySlot.time == visit_time,
+            AvailabilitySlot.confirmed_count > 0
+        ).values(confirmed_count=AvailabilitySlot.confirmed_count - 1)
+    )
+
+
+def slot_fits_party(
+    db: Session,
+    restaurant_id: int,
+    visit_date: date,
+    visit_time: time,
+    party_size: int
+) -> bool:
+    """
+    Check that a slot exists and is large enough for a party.
+
+    Used when a confirmed booking changes its party size without moving,
+    so it keeps its existing hold on the slot.
+
+    Args:
+        db: Database session
+        restaurant_id: The restaurant's primary key
+        visit_date: Date of the slot
+        visit_time: Time of the slot
+        party_size: Number of people in the party
+
+    Returns:
+        bool: True if the slot's max_party_size covers the party
+    """
+    return db.query(AvailabilitySlot.id).filter(
+        AvailabilitySlot.restaurant_id == restaurant_id,
+        AvailabilitySlot.date == visit_date,
+        AvailabilitySlot.time == visit_time,
+        AvailabilitySlot.max_party_size >= party_size
+    ).first() is not None
+
+
+class CustomerData(BaseModel):
+    Title: Optional[str] = None
+    FirstName: Optional[str] = None
+    Surname: Optional[str] = None
+    MobileCountryCode: Optional[str] = None
+    Mobile: Optional[str] = None
+    PhoneCountryCode: Optional[str] = None
+    Phone: Optional[str] = None
+    Email: Optional[str] = None
+    ReceiveEmailMarketing: Optional[bool] = None
+    ReceiveSmsMarketing: Optional[bool] = None
+    GroupEmailMarketingOptInText: Optional[str] = None
+    GroupSmsMarketingOptInText: Optional[str] = None
+    ReceiveRestaurantEmailMarketing: Optional[bool] = None
+    ReceiveRestaurantSmsMarketing: Optional[bool] = None
+    RestaurantEmailMarketingOptInText: Optional[str] = None
+    RestaurantSmsMarketingOptInText: Optional[str] = None
+
+
+def search_availability(
+    db: Session,
+    restaurant_name: str,
+    visit_date: date,
+    party_size: int,
+    channel_code: str
+) -> Dict[str, Any]:
+    """
+    Search the available slots of one restaurant and date.
+
+    Results are served from the availability cache when present.
+
+    Args:
+        db: Database session
+        restaurant_name: The name of the restaurant
+        visit_date: The desired visit date
+        party_size: Number of people in the party
+        channel_code: The booking channel identifier
+
+    Returns:
+        Dict containing restaurant info and available time slots
+
+    Raises:
+        HTTPException: 404 if restaurant not found
+    """
+    restaurant_id = get_restaurant_id(restaurant_name)
+
+    available_slots = availability_cache.get(restaurant_id, visit_date, party_size)
+    if available_slots is None:
+        # Taken before the read so a booking committed meanwhile voids the result
+        generation = availability_cache.generation(restaurant_id, visit_date)
+        available_slots = search_slots(db, restaurant_id, visit_date, party_size)
+        availability_cache.set(
+            restaurant_id, visit_date, party_size, available_slots, generation=generation
+        )
+
+    return {
+        "restaurant": restaurant_name,
+        "restaurant_id": restaurant_id,
+        "visit_date": visit_date,
+        "party_size": party_size,
+        "channel_code": channel_code,
+        "available_slots": available_slots,
+        "total_slots": len(available_slots)
+    }
+
+
+def search_availability_range(
+    db: Session,
+    restaurant_name: str,
+    date_from: date,
+    date_to: date,
+    party_size: int,
+    channel_code: str,
+    weekdays: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Search the available slots of one restaurant across a window of dates.
+
+    Args:
+        db: Database session
+        restaurant_name: The name of the restaurant
+        date_from: The first date of the window (inclusive)
+        date_to: The last date of the window (inclusive)
+        party_size: Number of people in the party
+        channel_code: The booking channel identifier
+        weekdays: Optional comma-separated weekday filter (0=Monday ... 6=Sunday)
+
+    Returns:
+        Dict containing restaurant info and per-day slots
+
+    Raises:
+        HTTPException: 400 if the window or weekday filter is invalid
+        HTTPException: 404 if restaurant not found
+    """
+    if date_to < date_from:
+        raise HTTPException(status_code=400, detail="VisitDateTo is before VisitDateFrom")
+    span = (date_to - date_from).days + 1
+    if span > MAX_RANGE_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Date range cannot exceed {MAX_RANGE_DAYS} days"
+        )
+    weekday_filter = parse_weekdays(weekdays)
+
+    restaurant_id = get_restaurant_id(restaurant_name)
+
+    visit_dates = [
+        date_from + timedelta(days=offset) for offset in range(span)
+        if weekday_filter is None or (date_from + timedelta(days=offset)).weekday() in weekday_filter
+    ]
+    days = search_slots_range(db, restaurant_id, visit_dates, party_size)
+
+    return {
+        "restaurant": restaurant_name,
+        "restaurant_id": restaurant_id,
+        "visit_date_from": date_from,
+        "visit_date_to": date_to,
+        "party_size": party_size,
+        "channel_code": channel_code,
+        "days": days,
+        "total_days": len(days)
+    }
+
+
+def create_booking(
+    db: Session,
+    restaurant_name: str,
+    visit_date: date,
+    visit_time: time,
+    party_size: int,
+    channel_code: str,
+    special_requests: Optional[str] = None,
+    is_leave_time_confirmed: Optional[bool] = None,
+    room_number: Optional[str] = None,
+    customer_data: Optional[CustomerData] = None
+) -> Dict[str, Any]:
+    """
+    Create a confirmed booking, claiming capacity on its slot.
+
+    The whole booking is one unit of work: customer, slot reservation and
+    booking commit together. A reference collision surfaces as an
+    IntegrityError on the unique constraint and the unit is retried.
+
+    Args:
+        db: Database session
+        restaurant_name: The name of the restaurant
+        visit_date: Date of the visit
+        visit_time: Time of the visit
+        party_size: Number of people in the party
+        channel_code: The booking channel identifier
+        special_requests: Optional free-text requests
+        is_leave_time_confirmed: Whether the leave time was confirmed
+        room_number: Optional hotel room number
+        customer_data: Customer details; an existing customer with the same
+            email is reused
+
+    Returns:
+        Dict describing the created booking
+
+    Raises:
+        HTTPException: 400 if the slot is not available
+        HTTPException: 404 if restaurant not found
+        HTTPException: 500 if no unique booking reference could be allocated
+    """
+    restaurant_id = get_restaurant_id(restaurant_name)
+    details = customer_data or CustomerData()
+
+    for _ in range(BOOKING_REFERENCE_ATTEMPTS):
+        # Create or find customer
+        customer = None
+        if details.Email:
+            customer = db.query(Customer).filter(Customer.email == details.Email).first()
+
+        if not customer:
+            customer = Customer(
+                title=details.Title,
+                first_name=details.FirstName,
+                surname=details.Surname,
+                mobile_country_code=details.MobileCountryCode,
+                mobile=details.Mobile,
+                phone_country_code=details.PhoneCountryCode,
+                phone=details.Phone,
+                email=details.Email,
+                receive_email_marketing=details.ReceiveEmailMarketing or False,
+                receive_sms_marketing=details.ReceiveSmsMarketing or False,
+                group_email_marketing_opt_in_text=details.GroupEmailMarketingOptInText,
+                group_sms_marketing_opt_in_text=details.GroupSmsMarketingOptInText,
+                receive_restaurant_email_marketing=details.ReceiveRestaurantEmailMarketing or False,
+                receive_restaurant_sms_marketing=details.ReceiveRestaurantSmsMarketing or False,
+                restaurant_email_marketing_opt_in_text=details.RestaurantEmailMarketingOptInText,
+                restaurant_sms_marketing_opt_in_text=details.RestaurantSmsMarketingOptInText
+            )
+            db.add(customer)
+
+        # Claim capacity in the same transaction as the insert
+        if not reserve_slot(db, restaurant_id, visit_date, visit_time, party_size):
+            db.rollback()
+            raise HTTPException(
+                status_code=400,
+                detail="Requested time slot is not available"
+            )
+
+        # Create booking
+        booking = Booking(
+            booking_reference=generate_booking_reference(),
+            restaurant_id=restaurant_id,
+            customer=customer,
+            visit_date=visit_date,
+            visit_time=visit_time,
+            party_size=party_size,
+            channel_code=channel_code,
+            special_requests=special_requests,
+            is_leave_time_confirmed=is_leave_time_confirmed or False,
+            room_number=room_number,
+            status="confirmed"
+        )
+        db.add(booking)
+
+        try:
+            db.flush()
+        except IntegrityError:
+            db.rollback()
+            continue
+
+        # Build the response from the flushed state; commit expires it
+        response = {
+            "booking_reference": booking.booking_reference,
+            "booking_id": booking.id,
+            "restaurant": restaurant_name,
+            "visit_date": visit_date,
+            "visit_time": visit_time,
+            "party_size": party_size,
+            "channel_code": channel_code,
+            "special_requests": special_requests,
+            "is_leave_time_confirmed": is_leave_time_confirmed,
+            "room_number": room_number,
+            "customer": {
+                "id": customer.id,
+                "title": customer.title,
+                "first_name": customer.first_name,
+                "surname": customer.surname,
+                "email": customer.email,
+                "mobile": customer.mobile
+            },
+            "status": "confirmed",
+            "created_at": booking.created_at
+        }
+        db.commit()
+        availability_cache.invalidate(restaurant_id, visit_date)
+        return response
+
+    raise HTTPException(
+        status_code=500,
+        detail="Could not allocate a unique booking reference"
+    )
+
+
+def _find_booking(db: Session, restaurant_id: int, booking_reference: str) -> Booking:
+    """Load a restaurant's booking by reference or raise 404."""
+    booking = db.query(Booking).filter(
+        Booking.booking_reference == booking_reference,
+        Booking.restaurant_id == restaurant_id
+    ).first()
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    return booking
+
+
+def cancel_booking(
+    db: Session,
+    restaurant_name: str,
+    booking_reference: str,
+    cancellation_reason_id: int,
+    microsite_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Cancel a booking, releasing its slot if it was holding one.
+
+    Args:
+        db: Database session
+        restaurant_name: The name of the restaurant
+        booking_reference: Reference of the booking to cancel
+        cancellation_reason_id: Id of the cancellation reason
+        microsite_name: Microsite echoed back in the response
+
+    Returns:
+        Dict describing the cancellation
+
+    Raises:
+        HTTPException: 400 if already cancelled or the reason is invalid
+        HTTPException: 404 if restaurant or booking not found
+    """
+    restaurant_id = get_restaurant_id(restaurant_name)
+    booking = _find_booking(db, restaurant_id, booking_reference)
+
+    # Check if already cancelled
+    if booking.status == "cancelled":
+        raise HTTPException(status_code=400, detail="Booking is already cancelled")
+
+    # Validate cancellation reason
+    cancellation_reason = db.query(CancellationReason).filter(
+        CancellationReason.id == cancellation_reason_id
+    ).first()
+    if not cancellation_reason:
+        raise HTTPException(status_code=400, detail="Invalid cancellation reason")
+
+    # Update booking status, releasing its slot if it was holding one
+    if booking.status == "confirmed":
+        release_slot(db, restaurant_id, booking.visit_date, booking.visit_time)
+    booking.status = "cancelled"
+    booking.cancellation_reason_id = cancellation_reason_id
+    booking.updated_at = datetime.utcnow()
+
+    db.commit()
+    db.refresh(booking)
+    availability_cache.invalidate(restaurant_id, booking.visit_date)
+
+    return {
+        "booking_reference": booking_reference,
+        "booking_id": booking.id,
+        "restaurant": restaurant_name,
+        "microsite_name": microsite_name,
+        "cancellation_reason_id": cancellation_reason_id,
+        "cancellation_reason": cancellation_reason.reason,
+        "status": "cancelled",
+        "cancelled_at": booking.updated_at,
+        "message": f"Booking {booking_reference} has been successfully cancelled"
+    }
+
+
+def get_booking(db: Session, restaurant_name: str, booking_reference: str) -> Dict[str, Any]:
+    """
+    Get a booking with its customer and cancellation reason.
+
+    Args:
+        db: Database session
+        restaurant_name: The name of the restaurant
+        booking_reference: Reference of the booking
+
+    Returns:
+        Dict describing the booking
+
+    Raises:
+        HTTPException: 404 if restaurant or booking not found
+    """
+    restaurant_id = get_restaurant_id(restaurant_name)
+    booking = _find_booking(db, restaurant_id, booking_reference)
+
+    # Get cancellation reason if cancelled
+    cancellation_reason = None
+    if booking.status == "cancelled" and booking.cancellation_reason_id:
+        reason = db.query(CancellationReason).filter(
+            CancellationReason.id == booking.cancellation_reason_id
+        ).first()
+        if reason:
+            cancellation_reason = {
+                "id": reason.id,
+                "reason": reason.reason,
+                "description": reason.description
+            }
+
+    return {
+        "booking_reference": booking_reference,
+        "booking_id": booking.id,
+        "restaurant": restaurant_name,
+        "visit_date": booking.visit_date,
+        "visit_time": booking.visit_time,
+        "party_size": booking.party_size,
+        "channel_code": booking.channel_code,
+        "special_requests": booking.special_requests,
+        "is_leave_time_confirmed": booking.is_leave_time_confirmed,
+        "room_number": booking.room_number,
+        "status": booking.status,
+        "customer": {
+            "id": booking.customer.id,
+            "title": booking.customer.title,
+            "first_name": booking.customer.first_name,
+            "surname": booking.customer.surname,
+            "email": booking.customer.email,
+            "mobile": booking.customer.mobile,
+            "phone": booking.customer.phone
+        },
+        "cancellation_reason": cancellation_reason,
+        "created_at": booking.created_at,
+        "updated_at": booking.updated_at
+    }
+
+
+def update_booking(
+    db: Session,
+    restaurant_name: str,
+    booking_reference: str,
+    visit_date: Optional[date] = None,
+    visit_time: Optional[time] = None,
+    party_size: Optional[int] = None,
+    special_requests: Optional[str] = None,
+    is_leave_time_confirmed: Optional[bool] = None
+) -> Dict[str, Any]:
+    """
+    Update a booking; fields left as None are unchanged.
+
+    A reschedule moves the booking's hold from the old slot to the new one;
+    a party size change on the same slot re-checks the slot's limit.
+
+    Args:
+        db: Database session
+        restaurant_name: The name of the restaurant
+        booking_reference: Reference of the booking to update
+        visit_date: New visit date
+        visit_time: New visit time
+        party_size: New party size
+        special_requests: New special requests
+        is_leave_time_confirmed: New leave-time confirmation
+
+    Returns:
+        Dict with the applied updates
+
+    Raises:
+        HTTPException: 400 if cancelled or the new slot cannot take the party
+        HTTPException: 404 if restaurant or booking not found
+    """
+    restaurant_id = get_restaurant_id(restaurant_name)
+    booking = _find_booking(db, restaurant_id, booking_reference)
+
+    # Check if booking can be updated
+    if booking.status == "cancelled":
+        raise HTTPException(status_code=400, detail="Cannot update cancelled booking")
+
+    # Track updates
+    updates = {}
+    original_date = booking.visit_date
+    original_time = booking.visit_time
+
+    if visit_date is not None and visit_date != booking.visit_date:
+        booking.visit_date = visit_date
+        updates["visit_date"] = visit_date
+
+    if visit_time is not None and visit_time != booking.visit_time:
+        booking.visit_time = visit_time
+        updates["visit_time"] = visit_time
+
+    if party_size is not None and party_size != booking.party_size:
+        booking.party_size = party_size
+        updates["party_size"] = party_size
+
+    if special_requests is not None and special_requests != booking.special_requests:
+        booking.special_requests = special_requests
+        updates["special_requests"] = special_requests
+
+    if (is_leave_time_confirmed is not None and
+            is_leave_time_confirmed != booking.is_leave_time_confirmed):
+        booking.is_leave_time_confirmed = is_leave_time_confirmed
+        updates["is_leave_time_confirmed"] = is_leave_time_confirmed
+
+    updated = bool(updates)
+    if updated:
+        booking.updated_at = datetime.utcnow()
+        # Move the booking's hold from the old slot to the new one
+        if booking.status == "confirmed" and (
+                booking.visit_date != original_date or booking.visit_time != original_time):
+            if not reserve_slot(db, restaurant_id, booking.visit_date,
+                                booking.visit_time, booking.party_size):
+                db.rollback()
+                raise HTTPException(
+                    status_code=400,
+                    detail="Requested time slot is not available"
+                )
+            release_slot(db, restaurant_id, original_date, original_time)
+        elif booking.status == "confirmed" and "party_size" in updates:
+            # Same slot, so the hold stays; only the party size limit is re-checked
+            if not slot_fits_party(db, restaurant_id, booking.visit_date,
+                                   booking.visit_time, booking.party_size):
+                db.rollback()
+                raise HTTPException(
+                    status_code=400,
+                    detail="Party size exceeds the maximum for this time slot"
+                )
+        db.commit()
+        db.refresh(booking)
+        # A reschedule frees capacity on the old date and takes it on the new one
+        availability_cache.invalidate(restaurant_id, original_date, booking.visit_date)
+
+    return {
+        "booking_reference": booking_reference,
+        "booking_id": booking.id,
+        "restaurant": restaurant_name,
+        "updates": updates,
+        "status": "updated" if updated else "no_changes",
+        "updated_at": booking.updated_at,
+        "message": (
+            f"Booking {booking_reference} has been "
+            f"{'successfully updated' if updated else 'checked - no changes made'}"
+        )
+    }
@@ -1,68 +1,319 @@
-import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, time
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+
 import requests
-from typing import List, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8547")
-TOKEN    = os.getenv("BACKEND_BEARER_TOKEN")
+from app.core.config import (
+    API_BASE,
+    BACKEND_TOKEN,
+    API_TRANSPORT,
+    API_CONNECT_TIMEOUT,
+    API_READ_TIMEOUT,
+    API_RETRIES,
+    API_RETRY_BACKOFF,
+    API_POOL_MAXSIZE,
+    API_FANOUT_CONCURRENCY,
+    RESTAURANT_NAME,
+)
 
-def _headers() -> Dict[str, str]:
-    return {"Authorization": f"Bearer {TOKEN}"}
+BASE_URL  = API_BASE
+TOKEN     = BACKEND_TOKEN
+TIMEOUT   = (API_CONNECT_TIMEOUT, API_READ_TIMEOUT)
+TRANSPORT = API_TRANSPORT
 
-def availability(visit_date: str, party_size: int | str, channel: str = "ONLINE") -> List[str]:
-    r = requests.post(
-        f"{BASE_URL}/api/ConsumerApi/v1/Restaurant/TheHungryUnicorn/AvailabilitySearch",
-        headers=_headers(),
-        data={"VisitDate": visit_date, "PartySize": party_size, "ChannelCode": channel},
-    )
+# Owns the keep-alive connection pools. Retries are passed per request by
+# each adapter, so the read and write sessions below share these connections
+# while keeping their own retry policies.
+_pool = HTTPAdapter(pool_maxsize=API_POOL_MAXSIZE)
+
+def _session(retry: Retry) -> requests.Session:
+    """Keep-alive session whose connections are reused across calls and threads."""
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=retry)
+    adapter.poolmanager = _pool.poolmanager
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Authorization"] = f"Bearer {TOKEN}"
+    return session
+
+# Reads (including the POST availability searches) are retried with backoff
+# on connection errors, timeouts and 502/503/504.
+_read_session = _session(Retry(
+    total=API_RETRIES,
+    backoff_factor=API_RETRY_BACKOFF,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=None,
+    raise_on_status=False,
+))
+# Writes are only retried when the connection could not be opened, i.e. the
+# request was never sent, so a booking is never submitted twice.
+_write_session = _session(Retry(
+    total=API_RETRIES,
+    connect=API_RETRIES,
+    read=0,
+    status=0,
+    other=0,
+    backoff_factor=API_RETRY_BACKOFF,
+))
+
+def _url(restaurant: str, path: str) -> str:
+    return f"{BASE_URL}/api/ConsumerApi/v1/Restaurant/{restaurant}/{path}"
+
+# In-process transport (API_TRANSPORT=local): the booking service functions
+# the routes are built on are called directly with a session from the app's
+# pool, skipping form encoding and the loopback socket. Form values are
+# validated against the field types below, and results go through
+# jsonable_encoder so both transports return the same JSON-shaped dicts.
+# Errors surface as the service's HTTPException instead of requests.HTTPError.
+
+# (form key, service argument, type, required) per service function
+_FORMS: Dict[str, Tuple[Tuple[str, str, Any, bool], ...]] = {
+    "search_availability": (
+        ("VisitDate", "visit_date", date, True),
+        ("PartySize", "party_size", int, True),
+        ("ChannelCode", "channel_code", str, True),
+    ),
+    "search_availability_range": (
+        ("VisitDateFrom", "date_from", date, True),
+        ("VisitDateTo", "date_to", date, True),
+        ("PartySize", "party_size", int, True),
+        ("ChannelCode", "channel_code", str, True),
+        ("Weekdays", "weekdays", Optional[str], False),
+    ),
+    "create_booking": (
+        ("VisitDate", "visit_date", date, True),
+        ("VisitTime", "visit_time", time, True),
+        ("PartySize", "party_size", int, True),
+        ("ChannelCode", "channel_code", str, True),
+        ("SpecialRequests", "special_requests", Optional[str], False),
+        ("IsLeaveTimeConfirmed", "is_leave_time_confirmed", Optional[bool], False),
+        ("RoomNumber", "room_number", Optional[str], False),
+    ),
+    "get_booking": (),
+    "update_booking": (
+        ("VisitDate", "visit_date", Optional[date], False),
+        ("VisitTime", "visit_time", Optional[time], False),
+        ("PartySize", "party_size", Optional[int], False),
+        ("SpecialRequests", "special_requests", Optional[str], False),
+        ("IsLeaveTimeConfirmed", "is_leave_time_confirmed", Optional[bool], False),
+    ),
+    "cancel_booking": (
+        ("cancellationReasonId", "cancellation_reason_id", int, True),
+        ("micrositeName", "microsite_name", Optional[str], False),
+    ),
+}
+
+@lru_cache(maxsize=None)
+def _adapter(annotation: Any) -> Any:
+    from pydantic import TypeAdapter
+    return TypeAdapter(annotation)
+
+def _form_kwargs(service: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    # Imported on first use so HTTP-only deployments never load the API app
+    from fastapi import HTTPException
+    from pydantic import ValidationError
+
+    kwargs: Dict[str, Any] = {}
+    missing = []
+    for key, name, annotation, required in _FORMS[service]:
+        if data.get(key) is None:
+            if required:
+                missing.append(key)
+            continue
+        try:
+            kwargs[name] = _adapter(annotation).validate_python(data[key])
+        except ValidationError:
+            raise HTTPException(status_code=422, detail=f"Invalid value for {key}")
+    if missing:
+        raise HTTPException(status_code=422, detail=f"Missing fields: {', '.join(missing)}")
+    if service == "create_booking":
+        from app.services.booking_service import CustomerData
+        customer = {
+            key[len("Customer["):-1]: value
+            for key, value in data.items()
+            if key.startswith("Customer[") and key.endswith("]") and value is not None
+        }
+        try:
+            kwargs["customer_data"] = CustomerData.model_validate(customer)
+        except ValidationError:
+            raise HTTPException(status_code=422, detail="Invalid customer details")
+    return kwargs
+
+def _call_service(service: str, restaurant: str, data: Dict[str, Any], **path: Any) -> Any:
+    from fastapi.encoders import jsonable_encoder
+
+    from app.database import SessionLocal
+    from app.services import booking_service
+
+    kwargs = _form_kwargs(service, data)
+    with SessionLocal() as db:
+        return jsonable_encoder(
+            getattr(booking_service, service)(db, restaurant, **path, **kwargs)
+        )
+
+def _call(
+    session: requests.Session,
+    method: str,
+    restaurant: str,
+    path: str,
+    service: str,
+    data: Dict[str, Any] | None = None,
+    **path_params: Any,
+) -> Any:
+    if TRANSPORT == "local":
+        return _call_service(service, restaurant, data or {}, **path_params)
+    r = session.request(method, _url(restaurant, path), data=data, timeout=TIMEOUT)
     r.raise_for_status()
-    data = r.json()
+    return r.json()
+
+def availability(
+    visit_date: str,
+    party_size: int | str,
+    channel: str = "ONLINE",
+    restaurant: str = RESTAURANT_NAME,
+) -> List[str]:
+    data = _call(
+        _read_session, "POST", restaurant, "AvailabilitySearch",
+        "search_availability",
+        {"VisitDate": visit_date, "PartySize": party_size, "ChannelCode": channel},
+    )
     return [s["time"] for s in data.get("available_slots", []) if s.get("available")]
 
-def create_booking(form: Dict[str, Any]) -> Dict[str, Any]:
-    r = requests.post(
-        f"{BASE_URL}/api/ConsumerApi/v1/Restaurant/TheHungryUnicorn/BookingWithStripeToken",
-        headers=_headers(),
-        data=form,
+def availability_range(
+    date_from: str,
+    date_to: str,
+    party_size: int | str,
+    channel: str = "ONLINE",
+    weekdays: str | None = None,
+    restaurant: str = RESTAURANT_NAME,
+) -> Dict[str, List[str]]:
+    form = {
+        "VisitDateFrom": date_from,
+        "VisitDateTo": date_to,
+        "PartySize": party_size,
+        "ChannelCode": channel,
+    }
+    if weekdays:
+        form["Weekdays"] = weekdays
+    data = _call(
+        _read_session, "POST", restaurant, "AvailabilitySearchRange",
+        "search_availability_range", form,
     )
-    r.raise_for_status()
-    return r.json()
+    return {
+        day["visit_date"]: [s["time"] for s in day.get("available_slots", []) if s.get("available")]
+        for day in data.get("days", [])
+    }
+
+# Statuses meaning the backend has no such endpoint, as opposed to failing
+UNSUPPORTED_STATUSES = (404, 405, 501)
 
-def get_booking(ref: str) -> Dict[str, Any]:
-    r = requests.get(
-        f"{BASE_URL}/api/ConsumerApi/v1/Restaurant/TheHungryUnicorn/Booking/{ref}",
-        headers=_headers(),
+def is_unsupported(error: Exception) -> bool:
+    """True if ``error`` says the endpoint does not exist on this backend.
+
+    Covers both transports: requests.HTTPError over HTTP and the service's
+    HTTPException in process. Timeouts, connection errors and 5xx are not.
+    """
+    response = getattr(error, "response", None)
+    status = response.status_code if response is not None else getattr(error, "status_code", None)
+    return status in UNSUPPORTED_STATUSES
+
+def availability_many(
+    visit_dates: List[str],
+    party_size: int | str,
+    channel: str = "ONLINE",
+    restaurant: str = RESTAURANT_NAME,
+    max_concurrency: int = API_FANOUT_CONCURRENCY,
+) -> Dict[str, List[str] | Exception]:
+    """One availability search per date, at most max_concurrency at a time.
+
+    Takes as long as the slowest search rather than the sum. A date whose
+    search fails maps to the exception, so callers keep the dates that worked.
+    """
+    def search(visit_date: str) -> List[str] | Exception:
+        try:
+            return availability(visit_date, party_size, channel, restaurant=restaurant)
+        except Exception as e:
+            return e
+
+    dates = list(dict.fromkeys(visit_dates))
+    if len(dates) <= 1 or max_concurrency <= 1:
+        return {d: search(d) for d in dates}
+    with ThreadPoolExecutor(max_workers=min(len(dates), max_concurrency)) as pool:
+        return dict(zip(dates, pool.map(search, dates)))
+
+def create_booking(form: Dict[str, Any], restaurant: str = RESTAURANT_NAME) -> Dict[str, Any]:
+    return _call(
+        _write_session, "POST", restaurant, "BookingWithStripeToken",
+        "create_booking", form,
     )
-    r.raise_for_status()
-    return r.json()
 
-def update_booking(ref: str, data: Dict[str, Any]) -> Dict[str, Any]:
-    r = requests.patch(
-        f"{BASE_URL}/api/ConsumerApi/v1/Restaurant/TheHungryUnicorn/Booking/{ref}",
-        headers=_headers(),
-        data=data,
+def get_booking(ref: str, restaurant: str = RESTAURANT_NAME) -> Dict[str, Any]:
+    return _call(
+        _read_session, "GET", restaurant, f"Booking/{ref}",
+        "get_booking", booking_reference=ref,
     )
-    r.raise_for_status()
-    return r.json()
 
-def cancel_booking(ref: str, reason_id: int) -> Dict[str, Any]:
-    r = requests.post(
-        f"{BASE_URL}/api/ConsumerApi/v1/Restaurant/TheHungryUnicorn/Booking/{ref}/Cancel",
-        headers=_headers(),
-        data={
-            "micrositeName": "TheHungryUnicorn",
+def update_booking(ref: str, data: Dict[str, Any], restaurant: str = RESTAURANT_NAME) -> Dict[str, Any]:
+    return _call(
+        _write_session, "PATCH", restaurant, f"Booking/{ref}",
+        "update_booking", data, booking_reference=ref,
+    )
+
+def cancel_booking(ref: str, reason_id: int, restaurant: str = RESTAURANT_NAME) -> Dict[str, Any]:
+    return _call(
+        _write_session, "POST", restaurant, f"Booking/{ref}/Cancel",
+        "cancel_booking",
+        {
+            "micrositeName": restaurant,
             "bookingReference": ref,
             "cancellationReasonId": reason_id,
         },
+        booking_reference=ref,
     )
-    r.raise_for_status()
-    return r.json()
 
+# Async variants run the blocking call in a worker thread, so async callers
+# share the same transport, keep-alive connections, timeouts and retries.
+
+async def availability_async(*args, **kwargs) -> List[str]:
+    return await asyncio.to_thread(availability, *args, **kwargs)
+
+async def availability_range_async(*args, **kwargs) -> Dict[str, List[str]]:
+    return await asyncio.to_thread(availability_range, *args, **kwargs)
+
+async def availability_many_async(*args, **kwargs) -> Dict[str, List[str] | Exception]:
+    return await asyncio.to_thread(availability_many, *args, **kwargs)
+
+async def create_booking_async(*args, **kwargs) -> Dict[str, Any]:
+    return await asyncio.to_thread(create_booking, *args, **kwargs)
+
+async def get_booking_async(*args, **kwargs) -> Dict[str, Any]:
+    return await asyncio.to_thread(get_booking, *args, **kwargs)
+
+async def update_booking_async(*args, **kwargs) -> Dict[str, Any]:
+    return await asyncio.to_thread(update_booking, *args, **kwargs)
 
+async def cancel_booking_async(*args, **kwargs) -> Dict[str, Any]:
+    return await asyncio.to_thread(cancel_booking, *args, **kwargs)
 
 __all__ = [
     "availability",
+    "availability_range",
+    "availability_many",
+    "is_unsupported",
     "create_booking",
     "get_booking",
     "update_booking",
     "cancel_booking",
+    "availability_async",
+    "availability_range_async",
+    "availability_many_async",
+    "create_booking_async",
+    "get_booking_async",
+    "update_booking_async",
+    "cancel_booking_async",
 ]
@@ -1,19 +1,60 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 import re
 import zoneinfo
-import dateparser  
+
+from app.core.config import DATE_CACHE_MAX_ENTRIES
 
 WEEKDAYS = {
     "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
     "friday": 4, "saturday": 5, "sunday": 6
 }
+_NUM_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6,
+    "seven": 7, "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12,
+    "thirteen": 13, "fourteen": 14,
+}
+
+# Common phrases are resolved with these before falling back to dateparser,
+# which costs milliseconds per call
+_WEEKDAY = "|".join(WEEKDAYS)
+_WHITESPACE_RE = re.compile(r"\s+")
+NEXT_WEEKDAY_RE = re.compile(rf"\bnext\s+({_WEEKDAY})\b")
+THIS_WEEKDAY_RE = re.compile(rf"\bthis\s+({_WEEKDAY})\b")
+DAY_AFTER_TOMORROW_RE = re.compile(r"\bday\s+after\s+tomorrow\b")
+TOMORROW_RE = re.compile(r"\btomorrow\b")
+TODAY_RE = re.compile(r"\b(?:today|tonight)\b")
+IN_N_DAYS_RE = re.compile(
+    r"\bin\s+(\d{1,3}|%s)\s+(days?|weeks?)\b" % "|".join(_NUM_WORDS)
+)
+ISO_DATE_RE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+# Day first; the year is required with '-' or '.' so times like 7.30 never match
+DMY_DATE_RE = re.compile(
+    r"\b(\d{1,2})/(\d{1,2})(?:/(\d{2}|\d{4}))?\b|\b(\d{1,2})[.-](\d{1,2})[.-](\d{4})\b"
+)
+WEEKDAY_RE = re.compile(rf"\b({_WEEKDAY})\b")
+_MONTH = (
+    r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|"
+    r"sep(?:t|tember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+)
+_DAY_NUMBER = r"\d{1,2}(?:st|nd|rd|th)?"
+# A month name with a day number beside it ("6th november", "nov 6"), so the
+# verb in "may I book friday" is not taken for a month
+MONTH_RE = re.compile(
+    rf"\b{_DAY_NUMBER}\s+(?:of\s+)?{_MONTH}\b|\b{_MONTH}\s+{_DAY_NUMBER}\b"
+)
 
 @dataclass(frozen=True)
 class ResolvedDate:
     iso_date: str
-    label: str  # "weekend", "next weekday", "this weekday", "parser"
+    label: str  # "weekend-sat"/"weekend-sun", "next-weekday", "this-weekday", "weekday", "today",
+                # "tomorrow", "relative", "iso", "dmy", "parser"
+
+@lru_cache(maxsize=None)
+def _zone(tz: str) -> zoneinfo.ZoneInfo:
+    return zoneinfo.ZoneInfo(tz)
 
 def _midnight(dt: datetime) -> datetime:
     return dt.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -28,14 +69,24 @@ def _upcoming_weekend(base: datetime) -> tuple[datetime, datetime]:
     sat = _next_weekday(base, WEEKDAYS["saturday"], strict_next=False)
     sun = _next_weekday(base, WEEKDAYS["sunday"], strict_next=False)
     if base.weekday() == WEEKDAYS["sunday"]:
-        sat += timedelta(days=7); sun += timedelta(days=7)
+        # On a Sunday "this weekend" means the coming one; Saturday is already next
+        sun += timedelta(days=7)
     return sat, sun
 
-def resolve_dates(text: str, *, tz: str = "Europe/London", now: datetime | None = None) -> list[ResolvedDate]:
-    tzinfo = zoneinfo.ZoneInfo(tz)
-    base = (now or datetime.now(tzinfo)).astimezone(tzinfo)
-    t = text.lower()
+def _dmy(day: str, month: str, year: str | None, base: datetime) -> date | None:
+    """Build a day-first date; without a year, the next such date from today."""
+    try:
+        if year:
+            return date(int(year) + (2000 if len(year) == 2 else 0), int(month), int(day))
+        candidate = date(base.year, int(month), int(day))
+        if candidate < base.date():
+            candidate = date(base.year + 1, int(month), int(day))
+        return candidate
+    except ValueError:
+        return None
 
+def _resolve_rules(t: str, base: datetime) -> list[ResolvedDate] | None:
+    """Resolve the common phrases; None when none of them match."""
     # weekend
     if "weekend" in t:
         sat, sun = _upcoming_weekend(base)
@@ -45,18 +96,55 @@ def resolve_dates(text: str, *, tz: str = "Europe/London", now: datetime | None
         ]
 
     # next <weekday>
-    if m := re.search(r"\bnext\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b", t):
-        wd = WEEKDAYS[m.group(1)]
-        d = _next_weekday(base, wd, strict_next=True)
+    if m := NEXT_WEEKDAY_RE.search(t):
+        d = _next_weekday(base, WEEKDAYS[m.group(1)], strict_next=True)
         return [ResolvedDate(d.date().isoformat(), "next-weekday")]
 
     # this <weekday>
-    if m := re.search(r"\bthis\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b", t):
-        wd = WEEKDAYS[m.group(1)]
-        d = _next_weekday(base, wd, strict_next=False)
+    if m := THIS_WEEKDAY_RE.search(t):
+        d = _next_weekday(base, WEEKDAYS[m.group(1)], strict_next=False)
         return [ResolvedDate(d.date().isoformat(), "this-weekday")]
 
-    # fallback to dateparser
+    # explicit dates
+    if m := ISO_DATE_RE.search(t):
+        try:
+            d = date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+            return [ResolvedDate(d.isoformat(), "iso")]
+        except ValueError:
+            pass
+    if m := DMY_DATE_RE.search(t):
+        day, month, year = (m.group(1), m.group(2), m.group(3)) if m.group(1) else m.group(4, 5, 6)
+        d = _dmy(day, month, year, base)
+        if d:
+            return [ResolvedDate(d.isoformat(), "dmy")]
+
+    # relative days
+    if DAY_AFTER_TOMORROW_RE.search(t):
+        return [ResolvedDate((base.date() + timedelta(days=2)).isoformat(), "relative")]
+    if TOMORROW_RE.search(t):
+        return [ResolvedDate((base.date() + timedelta(days=1)).isoformat(), "tomorrow")]
+    if TODAY_RE.search(t):
+        return [ResolvedDate(base.date().isoformat(), "today")]
+    if m := IN_N_DAYS_RE.search(t):
+        n = int(m.group(1)) if m.group(1).isdigit() else _NUM_WORDS[m.group(1)]
+        days = n * 7 if m.group(2).startswith("week") else n
+        return [ResolvedDate((base.date() + timedelta(days=days)).isoformat(), "relative")]
+
+    # bare weekday, e.g. "on friday": the next one, a week ahead if it is today.
+    # "friday 6th november" names a calendar date and is left to dateparser
+    if (m := WEEKDAY_RE.search(t)) and not MONTH_RE.search(t):
+        d = _next_weekday(base, WEEKDAYS[m.group(1)], strict_next=True)
+        return [ResolvedDate(d.date().isoformat(), "weekday")]
+    return None
+
+def _resolve(text: str, tz: str, base: datetime) -> list[ResolvedDate]:
+    t = text.lower()
+    resolved = _resolve_rules(t, base)
+    if resolved is not None:
+        return resolved
+
+    # last resort: dateparser, imported on first use as it is slow to load
+    import dateparser
     dp = dateparser.parse(
         text,
         settings={
@@ -69,3 +157,15 @@ def resolve_dates(text: str, *, tz: str = "Europe/London", now: datetime | None
         languages=["en"],
     )
     return [ResolvedDate(_midnight(dp).date().isoformat(), "parser")] if dp else []
+
+@lru_cache(maxsize=DATE_CACHE_MAX_ENTRIES)
+def _resolve_cached(phrase: str, tz: str, today: date) -> tuple[ResolvedDate, ...]:
+    # Relative phrases only depend on the local date, so results are shared for the whole day
+    return tuple(_resolve(phrase, tz, datetime.now(_zone(tz))))
+
+def resolve_dates(text: str, *, tz: str = "Europe/London", now: datetime | None = None) -> list[ResolvedDate]:
+    tzinfo = _zone(tz)
+    if now is not None:
+        return _resolve(text, tz, now.astimezone(tzinfo))
+    phrase = _WHITESPACE_RE.sub(" ", text).strip()
+    return list(_resolve_cached(phrase, tz, datetime.now(tzinfo).date()))
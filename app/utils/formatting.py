@@ -1,7 +1,14 @@
 import datetime as dt
+import re
+
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<=[a-z])(?=[A-Z])")
 
 def pretty_time(hms: str) -> str:
     return dt.datetime.strptime(hms, "%H:%M:%S").strftime("%I:%M %p").lstrip("0")
 
 def pretty_date(iso_date: str) -> str:
     return dt.datetime.strptime(iso_date, "%Y-%m-%d").strftime("%A %b %d, %Y")
+
+def pretty_restaurant(name: str) -> str:
+    """'TheHungryUnicorn' -> 'The Hungry Unicorn'."""
+    return _CAMEL_BOUNDARY_RE.sub(" ", name)
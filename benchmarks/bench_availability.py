@@ -0,0 +1,120 @@
+"""
+Availability Search Benchmark.
+
+Seeds a throwaway SQLite database with a growing number of bookings and
+times ``search_slots`` for a single restaurant/date at each size. With the
+hot-path indexes in place the latency should stay flat as history grows;
+run with ``--no-indexes`` to compare against the unindexed schema.
+
+Usage:
+    python -m benchmarks.bench_availability
+    python -m benchmarks.bench_availability --sizes 1000 100000 10000000
+
+Author: AI Assistant
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time as timer
+from datetime import date, time, timedelta
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, Restaurant, Customer, Booking, AvailabilitySlot
+from app.services.booking_service import search_slots
+
+SLOT_TIMES = [time(h, m) for h in (12, 13, 19, 20) for m in (0, 30)]
+STATUSES = ["confirmed", "confirmed", "confirmed", "cancelled", "completed"]
+HISTORY_DAYS = 3650
+BATCH_SIZE = 50_000
+
+
+def _seed(engine, bookings: int, with_indexes: bool) -> date:
+    """Create the schema and insert ``bookings`` rows spread over history."""
+    Base.metadata.create_all(bind=engine)
+    if not with_indexes:
+        # Drop the composite hot-path indexes, keeping the single-column ones
+        for table in (Booking.__table__, AvailabilitySlot.__table__):
+            for index in table.indexes:
+                if len(index.columns) > 1:
+                    index.drop(bind=engine)
+
+    start = date.today() - timedelta(days=HISTORY_DAYS)
+    target = date.today() + timedelta(days=1)
+    rng = random.Random(42)
+
+    with engine.begin() as conn:
+        conn.execute(insert(Restaurant), [
+            {"id": 1, "name": "TheHungryUnicorn", "microsite_name": "TheHungryUnicorn"}
+        ])
+        conn.execute(insert(Customer), [{"id": 1, "first_name": "Bench"}])
+        conn.execute(insert(AvailabilitySlot), [
+            {
+                "restaurant_id": 1,
+                "date": start + timedelta(days=d),
+                "time": t,
+                "max_party_size": 8,
+                "available": True,
+            }
+            for d in range(HISTORY_DAYS + 2)
+            for t in SLOT_TIMES
+        ])
+
+    inserted = 0
+    while inserted < bookings:
+        size = min(BATCH_SIZE, bookings - inserted)
+        rows = [
+            {
+                "booking_reference": f"B{inserted + i:09d}",
+                "restaurant_id": 1,
+                "customer_id": 1,
+                "visit_date": start + timedelta(days=rng.randrange(HISTORY_DAYS + 2)),
+                "visit_time": rng.choice(SLOT_TIMES),
+                "party_size": rng.randint(1, 8),
+                "channel_code": "ONLINE",
+                "status": rng.choice(STATUSES),
+            }
+            for i in range(size)
+        ]
+        with engine.begin() as conn:
+            conn.execute(insert(Booking), rows)
+        inserted += size
+
+    return target
+
+
+def run(sizes, repeats: int, with_indexes: bool) -> None:
+    print(f"{'bookings':>12}  {'median ms':>10}  {'p95 ms':>10}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+            target = _seed(engine, size, with_indexes)
+            Session = sessionmaker(bind=engine)
+
+            samples = []
+            with Session() as db:
+                search_slots(db, 1, target, 2)  # warm the page cache
+                for _ in range(repeats):
+                    started = timer.perf_counter()
+                    search_slots(db, 1, target, 2)
+                    samples.append((timer.perf_counter() - started) * 1000)
+            engine.dispose()
+
+        samples.sort()
+        p95 = samples[int(len(samples) * 0.95) - 1]
+        print(f"{size:>12,}  {statistics.median(samples):>10.3f}  {p95:>10.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--no-indexes", action="store_true")
+    args = parser.parse_args()
+    run(args.sizes, args.repeats, not args.no_indexes)
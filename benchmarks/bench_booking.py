@@ -0,0 +1,112 @@
+"""
+Booking Creation Benchmark.
+
+Creates bookings through the BookingWithStripeToken route (or, with
+--batch, the BookingImport route) against a throwaway database and reports
+bookings per second together with the SQL statements and commits each
+booking costs.
+
+Usage:
+    python -m benchmarks.bench_booking --bookings 2000
+    python -m benchmarks.bench_booking --bookings 2000 --batch 500
+
+Author: AI Assistant
+"""
+
+import argparse
+import os
+import tempfile
+import time as timer
+from datetime import date, time, timedelta
+
+# Point the app at a throwaway database before it is imported
+_tmp = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp, 'bench.db')}"
+os.environ["AVAILABILITY_CACHE_MAX_ENTRIES"] = "0"
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event, insert  # noqa: E402
+
+from app.database import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import AvailabilitySlot, Restaurant  # noqa: E402
+from app.routers.availability import MOCK_BEARER_TOKEN  # noqa: E402
+from app.services.booking_service import MAX_BOOKINGS_PER_SLOT  # noqa: E402
+
+SLOT_TIMES = [time(h, m) for h in range(24) for m in range(0, 60, 5)]
+
+
+def _dense_slots(days: int) -> list:
+    """Open a slot every five minutes so capacity never runs out mid-run."""
+    with SessionLocal() as db:
+        restaurant_id = db.query(Restaurant.id).filter(
+            Restaurant.name == "TheHungryUnicorn"
+        ).scalar()
+    start = date.today() + timedelta(days=60)
+    slots = [
+        (start + timedelta(days=d), t)
+        for d in range(days)
+        for t in SLOT_TIMES
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(AvailabilitySlot), [
+            {"restaurant_id": restaurant_id, "date": d, "time": t,
+             "max_party_size": 8, "available": True}
+            for d, t in slots
+        ])
+    return [slot for slot in slots for _ in range(MAX_BOOKINGS_PER_SLOT)]
+
+
+def run(bookings: int, batch: int = 0) -> None:
+    statements = []
+    commits = []
+    event.listen(engine, "before_cursor_execute", lambda *args, **kw: statements.append(1))
+    event.listen(engine, "commit", lambda conn: commits.append(1))
+
+    with TestClient(app) as client:
+        days = bookings // (len(SLOT_TIMES) * MAX_BOOKINGS_PER_SLOT) + 1
+        slots = _dense_slots(days)
+        base = "/api/ConsumerApi/v1/Restaurant/TheHungryUnicorn"
+        headers = {"Authorization": f"Bearer {MOCK_BEARER_TOKEN}"}
+
+        statements.clear()
+        commits.clear()
+        started = timer.perf_counter()
+        if batch:
+            for start in range(0, bookings, batch):
+                rows = [{
+                    "VisitDate": slots[i][0].isoformat(),
+                    "VisitTime": slots[i][1].strftime("%H:%M:%S"),
+                    "PartySize": 2,
+                    "ChannelCode": "ONLINE",
+                    "Customer": {"FirstName": "Bench", "Email": f"bench{i % 500}@example.com"},
+                } for i in range(start, min(start + batch, bookings))]
+                r = client.post(f"{base}/BookingImport", headers=headers, json=rows)
+                r.raise_for_status()
+                assert r.json()["failed"] == 0, r.json()
+        else:
+            for i in range(bookings):
+                visit_date, visit_time = slots[i]
+                r = client.post(f"{base}/BookingWithStripeToken", headers=headers, data={
+                    "VisitDate": visit_date.isoformat(),
+                    "VisitTime": visit_time.strftime("%H:%M:%S"),
+                    "PartySize": 2,
+                    "ChannelCode": "ONLINE",
+                    "Customer[FirstName]": "Bench",
+                    "Customer[Email]": f"bench{i % 500}@example.com",
+                })
+                r.raise_for_status()
+        elapsed = timer.perf_counter() - started
+
+    print(f"bookings: {bookings} in {elapsed:.2f}s ({bookings / elapsed:.0f} bookings/s)")
+    print(f"per booking: {len(statements) / bookings:.1f} statements, "
+          f"{len(commits) / bookings:.1f} commits")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bookings", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=0,
+                        help="import in batches of this size instead of one POST per booking")
+    args = parser.parse_args()
+    run(args.bookings, args.batch)
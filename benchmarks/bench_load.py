@@ -0,0 +1,86 @@
+"""
+API Load Benchmark.
+
+Fires concurrent AvailabilitySearch requests at a running server while a
+probe repeatedly calls the lightweight ``GET /`` endpoint. Throughput shows
+how many searches the server sustains; probe latency shows whether database
+work is blocking the event loop for unrelated requests.
+
+Usage:
+    python -m app                      # in another shell
+    python -m benchmarks.bench_load --concurrency 32 --requests 2000
+
+Author: AI Assistant
+"""
+
+import argparse
+import statistics
+import threading
+import time as timer
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import requests
+
+from app.routers.availability import MOCK_BEARER_TOKEN
+
+HEADERS = {"Authorization": f"Bearer {MOCK_BEARER_TOKEN}"}
+
+
+def _percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[max(0, int(len(ordered) * pct) - 1)]
+
+
+def run(base_url: str, restaurant: str, concurrency: int, total: int) -> None:
+    url = f"{base_url}/api/ConsumerApi/v1/Restaurant/{restaurant}/AvailabilitySearch"
+    visit_date = (date.today() + timedelta(days=1)).isoformat()
+    local = threading.local()
+    done = threading.Event()
+    probe_samples = []
+
+    def session() -> requests.Session:
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        return local.session
+
+    def search(i: int) -> float:
+        data = {"VisitDate": visit_date, "PartySize": 1 + i % 8, "ChannelCode": "ONLINE"}
+        started = timer.perf_counter()
+        session().post(url, headers=HEADERS, data=data).raise_for_status()
+        return (timer.perf_counter() - started) * 1000
+
+    def probe() -> None:
+        with requests.Session() as s:
+            while not done.is_set():
+                started = timer.perf_counter()
+                s.get(f"{base_url}/").raise_for_status()
+                probe_samples.append((timer.perf_counter() - started) * 1000)
+                timer.sleep(0.01)
+
+    prober = threading.Thread(target=probe, daemon=True)
+    prober.start()
+    started = timer.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(search, range(total)))
+    elapsed = timer.perf_counter() - started
+    done.set()
+    prober.join()
+
+    print(f"searches: {total} at concurrency {concurrency} in {elapsed:.2f}s "
+          f"({total / elapsed:.0f} req/s)")
+    print(f"search latency ms  p50 {statistics.median(latencies):8.2f}  "
+          f"p99 {_percentile(latencies, 0.99):8.2f}")
+    if probe_samples:
+        print(f"probe  latency ms  p50 {statistics.median(probe_samples):8.2f}  "
+              f"p99 {_percentile(probe_samples, 0.99):8.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:8547")
+    parser.add_argument("--restaurant", default="TheHungryUnicorn")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    run(args.url, args.restaurant, args.concurrency, args.requests)
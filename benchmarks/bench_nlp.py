@@ -0,0 +1,133 @@
+"""
+NLP Helper Micro-benchmark.
+
+Times the chat agent's input helpers on a corpus of typical phrases:
+``resolve_dates`` through raw dateparser (the old path), the precompiled
+rules with the memo disabled, and the memoised resolver, then the slot
+normalisers, ``parse_input`` and the fast-path ``match_intent``. Finally
+checks the intent each message is routed to, including phrases where the
+word after "booking" must not be taken for a booking reference.
+
+Usage:
+    python -m benchmarks.bench_nlp
+    python -m benchmarks.bench_nlp --repeats 2000
+
+Author: AI Assistant
+"""
+
+import argparse
+import statistics
+import time as timer
+from datetime import datetime
+
+from app.agents.intents import match_intent
+from app.utils import dates
+from app.utils.nlp import normalize_date, normalize_party_size, normalize_time, parse_input
+
+TZ = "Europe/London"
+
+PHRASES = [
+    "today", "tonight", "tomorrow", "day after tomorrow", "in 3 days", "in two weeks",
+    "this weekend", "next friday", "this saturday", "friday", "2026-11-02", "15/08",
+    "12/11/2026", "12.11.2026", "VisitDate: 2026-11-02, PartySize: 4, ChannelCode: ONLINE",
+    "VisitDate: next friday, PartySize: 2, ChannelCode: ONLINE",
+    "Any tables tomorrow for 4?", "15 august",
+]
+MESSAGES = [
+    "availability 2026-11-02 for 4",
+    "any tables this weekend for two",
+    "book tomorrow at 7pm for 2",
+    "cancel booking ABC1234 reason 1",
+    "can I move my booking to friday?",
+    "show my booking details",
+    "cancel booking tonight reason 2",
+]
+# Intent each message must be routed to; None means the LLM agent
+EXPECTED_INTENTS = {
+    "availability 2026-11-02 for 4": "check_availability",
+    "any tables this weekend for two": "check_availability",
+    "book tomorrow at 7pm for 2": "create_booking",
+    "cancel booking ABC1234 reason 1": "cancel_booking",
+    "show booking ABC1234": "get_booking",
+    "booking ref: X9Y8Z7W": None,
+    "booking ref: X9Y8Z7W details": "get_booking",
+    "can I move my booking to friday?": None,
+    "show my booking details": None,
+    "view booking history": None,
+    "can I see the booking summary": None,
+    "what are my booking options": None,
+    "cancel booking tonight reason 2": None,
+    "show booking abc1234": None,
+}
+TOOL_INPUTS = [
+    "VisitDate: 2026-11-02, VisitTime: 19:00, PartySize: 4, ChannelCode: ONLINE",
+    "Booking_Reference: ABC1234, CancellationReasonId: 1",
+]
+
+
+def _dateparser(text: str) -> None:
+    import dateparser
+    dateparser.parse(
+        text,
+        settings={
+            "RELATIVE_BASE": datetime.now(dates._zone(TZ)),
+            "PREFER_DATES_FROM": "future",
+            "TIMEZONE": TZ,
+            "RETURN_AS_TIMEZONE_AWARE": True,
+            "DATE_ORDER": "DMY",
+        },
+        languages=["en"],
+    )
+
+
+def _uncached(text: str) -> None:
+    dates._resolve_cached.cache_clear()
+    dates.resolve_dates(text, tz=TZ)
+
+
+def _time(name: str, fn, inputs, repeats: int) -> None:
+    """Print median and p95 microseconds per call of ``fn`` over ``inputs``."""
+    for text in inputs:
+        fn(text)  # warm imports and caches
+    samples = []
+    for _ in range(repeats):
+        for text in inputs:
+            started = timer.perf_counter()
+            fn(text)
+            samples.append((timer.perf_counter() - started) * 1_000_000)
+    samples.sort()
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{name:<28}  {statistics.median(samples):>10.1f}  {p95:>10.1f}")
+
+
+def run(repeats: int) -> None:
+    print(f"{'helper':<28}  {'median us':>10}  {'p95 us':>10}")
+    _time("dateparser (baseline)", _dateparser, PHRASES, max(repeats // 20, 1))
+    _time("resolve_dates (no memo)", _uncached, PHRASES, repeats)
+    _time("resolve_dates (memoised)", lambda t: dates.resolve_dates(t, tz=TZ), PHRASES, repeats)
+    _time("normalize_date", lambda t: normalize_date(None, t), PHRASES, repeats)
+    _time("normalize_time", lambda t: normalize_time(None, t), MESSAGES, repeats)
+    _time("normalize_party_size", lambda t: normalize_party_size(None, t), MESSAGES, repeats)
+    _time("parse_input", parse_input, TOOL_INPUTS, repeats)
+    _time("match_intent", match_intent, MESSAGES, repeats)
+    print(f"date memo: {dates._resolve_cached.cache_info()}")
+    _check_intents()
+
+
+def _check_intents() -> None:
+    """Print each message whose fast-path intent differs from EXPECTED_INTENTS."""
+    wrong = 0
+    for message, expected in EXPECTED_INTENTS.items():
+        intent = match_intent(message)
+        got = intent.name if intent else None
+        if got != expected:
+            wrong += 1
+            print(f"  {message!r}: expected {expected}, got {got} ({intent and intent.tool_input})")
+    print(f"intent routing: {len(EXPECTED_INTENTS) - wrong}/{len(EXPECTED_INTENTS)} as expected")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=500)
+    args = parser.parse_args()
+    run(args.repeats)
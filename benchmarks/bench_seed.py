@@ -0,0 +1,89 @@
+"""
+Availability Seeding Benchmark.
+
+Seeds a temporary SQLite database with availability slots for many
+restaurants using the bulk schedule generator, optionally timing the old
+one-ORM-object-per-slot loop on the same workload for comparison.
+
+Usage:
+    python -m benchmarks.bench_seed --restaurants 500 --days 365
+    python -m benchmarks.bench_seed --restaurants 20 --days 365 --orm
+
+Author: AI Assistant
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time as timer
+from datetime import date, time
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.init_db import OpeningHours, generate_slot_schedule
+from app.models import AvailabilitySlot, Base, Restaurant
+
+# 11:00-21:00 every 15 minutes: 40 seatings a day
+TEMPLATE = OpeningHours(services=((time(11, 0), time(21, 0)),), interval_minutes=15)
+
+
+def _seed_restaurants(engine, count: int) -> list:
+    with engine.begin() as conn:
+        conn.execute(insert(Restaurant), [
+            {"name": f"Restaurant{i:04d}", "microsite_name": f"restaurant{i:04d}"}
+            for i in range(count)
+        ])
+        return list(conn.execute(select(Restaurant.id)).scalars())
+
+
+def _orm_loop(engine, restaurant_ids: list, start: date, days: int) -> None:
+    """The original init_db approach: nested loops, one ORM object per slot."""
+    with Session(engine) as db:
+        for restaurant_id in restaurant_ids:
+            for offset in range(days):
+                current_date = date.fromordinal(start.toordinal() + offset)
+                for slot_time in TEMPLATE.slot_times():
+                    db.add(AvailabilitySlot(
+                        restaurant_id=restaurant_id,
+                        date=current_date,
+                        time=slot_time,
+                        max_party_size=8,
+                        available=random.random() > 0.2
+                    ))
+        db.commit()
+
+
+def run(restaurants: int, days: int, orm: bool) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "seed.db")
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    restaurant_ids = _seed_restaurants(engine, restaurants)
+    start = date.today()
+
+    started = timer.perf_counter()
+    if orm:
+        _orm_loop(engine, restaurant_ids, start, days)
+    else:
+        with engine.begin() as conn:
+            generate_slot_schedule(
+                conn, {rid: TEMPLATE for rid in restaurant_ids}, start, days,
+                availability=0.8
+            )
+    elapsed = timer.perf_counter() - started
+
+    with engine.connect() as conn:
+        slots = conn.execute(select(func.count(AvailabilitySlot.id))).scalar()
+    label = "orm loop" if orm else "bulk generator"
+    print(f"{label}: {slots} slots ({restaurants} restaurants x {days} days) "
+          f"in {elapsed:.2f}s ({slots / elapsed:,.0f} slots/s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--restaurants", type=int, default=500)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--orm", action="store_true", help="time the per-object ORM loop instead")
+    args = parser.parse_args()
+    run(args.restaurants, args.days, args.orm)
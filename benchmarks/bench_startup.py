@@ -0,0 +1,108 @@
+"""
+API Startup Benchmark.
+
+Starts the API in fresh interpreters against a throwaway SQLite database and
+times each phase of a cold start: importing ``app.main``, the startup event,
+the first AvailabilitySearch and, with chat enabled, the first chat request
+(which loads the LangChain agent stack). Runs once with chat enabled and
+once as a booking-only replica (ENABLE_CHAT=false). ``import fastapi`` is
+timed too, as the floor no configuration can go below.
+
+Usage:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --repeats 10
+
+Author: AI Assistant
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import json, time
+from datetime import date, timedelta
+started = time.perf_counter()
+import app.main
+from fastapi.testclient import TestClient
+from app.core.config import ENABLE_CHAT
+from app.routers.availability import MOCK_BEARER_TOKEN
+phases = {"import": time.perf_counter() - started}
+
+visit_date = (date.today() + timedelta(days=1)).isoformat()
+mark = time.perf_counter()
+with TestClient(app.main.app) as client:
+    phases["startup"] = time.perf_counter() - mark
+
+    mark = time.perf_counter()
+    client.post(
+        "/api/ConsumerApi/v1/Restaurant/TheHungryUnicorn/AvailabilitySearch",
+        headers={"Authorization": f"Bearer {MOCK_BEARER_TOKEN}"},
+        data={"VisitDate": visit_date, "PartySize": 2, "ChannelCode": "ONLINE"},
+    ).raise_for_status()
+    phases["first_search"] = time.perf_counter() - mark
+
+    if ENABLE_CHAT:
+        mark = time.perf_counter()
+        client.post("/api/chat/", json={"message": f"availability {visit_date} for 2"}).raise_for_status()
+        phases["first_chat"] = time.perf_counter() - mark
+    phases["total"] = time.perf_counter() - started
+print(json.dumps(phases))
+"""
+
+FLOOR = """
+import json, time
+started = time.perf_counter()
+import fastapi
+print(json.dumps({"import": time.perf_counter() - started}))
+"""
+
+
+def _run(code: str, workdir: str, **env: str) -> dict:
+    """Run ``code`` in a fresh interpreter and return the phase timings it prints."""
+    child_env = {
+        **os.environ,
+        "PYTHONPATH": ROOT,
+        "DATABASE_URL": f"sqlite:///{os.path.join(workdir, 'startup.db')}",
+        "MAINTENANCE_INTERVAL": "0",
+        "API_TRANSPORT": "local",
+        "LLM_PROVIDER": "stub",
+        **env,
+    }
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=workdir, env=child_env,
+        capture_output=True, text=True, check=True, timeout=300,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def run(repeats: int) -> None:
+    configs = [
+        ("fastapi import (floor)", FLOOR, {}),
+        ("chat enabled", CHILD, {"ENABLE_CHAT": "true"}),
+        ("booking-only", CHILD, {"ENABLE_CHAT": "false"}),
+    ]
+    phases = ["import", "startup", "first_search", "first_chat", "total"]
+    print(f"{'configuration':<24}" + "".join(f"  {p + ' ms':>15}" for p in phases))
+    with tempfile.TemporaryDirectory() as tmp:
+        _run(CHILD, tmp, ENABLE_CHAT="false")  # create and seed the database once
+        for name, code, env in configs:
+            samples = [_run(code, tmp, **env) for _ in range(repeats)]
+            cells = []
+            for phase in phases:
+                values = [s[phase] * 1000 for s in samples if phase in s]
+                cells.append(f"{statistics.median(values):>15.0f}" if values else f"{'-':>15}")
+            print(f"{name:<24}" + "".join(f"  {c}" for c in cells))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    run(args.repeats)
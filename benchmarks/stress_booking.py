@@ -0,0 +1,96 @@
+"""
+Booking Concurrency Stress Test.
+
+Fires hundreds of simultaneous BookingWithStripeToken requests at a single
+slot of a running server and checks that the slot is never oversold: the
+number of accepted bookings must not exceed the capacity that was free
+before the burst.
+
+Usage:
+    python -m app                      # in another shell
+    python -m benchmarks.stress_booking --requests 300 --concurrency 100
+
+Author: AI Assistant
+"""
+
+import argparse
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import requests
+
+from app.routers.availability import MOCK_BEARER_TOKEN
+from app.services.booking_service import MAX_BOOKINGS_PER_SLOT
+
+HEADERS = {"Authorization": f"Bearer {MOCK_BEARER_TOKEN}"}
+
+
+def _slot(base: str, visit_date: str, visit_time: str = None):
+    """Return (time, current_bookings) for the given time, or the first open slot."""
+    r = requests.post(
+        f"{base}/AvailabilitySearch",
+        headers=HEADERS,
+        data={"VisitDate": visit_date, "PartySize": 2, "ChannelCode": "ONLINE"},
+    )
+    r.raise_for_status()
+    for slot in r.json()["available_slots"]:
+        if slot["time"] == visit_time or (visit_time is None and slot["available"]):
+            return slot["time"], slot["current_bookings"]
+    return None, None
+
+
+def run(base_url: str, restaurant: str, days_ahead: int, total: int, concurrency: int) -> int:
+    base = f"{base_url}/api/ConsumerApi/v1/Restaurant/{restaurant}"
+    visit_date = (date.today() + timedelta(days=days_ahead)).isoformat()
+    visit_time, before = _slot(base, visit_date)
+    if visit_time is None:
+        print(f"No open slot on {visit_date}; try another --days-ahead")
+        return 2
+
+    free = MAX_BOOKINGS_PER_SLOT - before
+    start = threading.Barrier(concurrency)
+
+    def book(i: int) -> int:
+        if i < concurrency:
+            start.wait()  # release the first wave at the same instant
+        r = requests.post(
+            f"{base}/BookingWithStripeToken",
+            headers=HEADERS,
+            data={
+                "VisitDate": visit_date,
+                "VisitTime": visit_time,
+                "PartySize": 2,
+                "ChannelCode": "ONLINE",
+                "Customer[Email]": f"stress{i}@example.com",
+            },
+        )
+        return r.status_code
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        statuses = Counter(pool.map(book, range(total)))
+
+    _, after = _slot(base, visit_date, visit_time)
+    accepted = statuses.get(200, 0)
+    print(f"slot {visit_date} {visit_time}: {free} free of {MAX_BOOKINGS_PER_SLOT}")
+    print(f"responses: {dict(statuses)}")
+    print(f"accepted {accepted}, confirmed count now {after}")
+
+    if accepted > free or (after is not None and after > MAX_BOOKINGS_PER_SLOT):
+        print("FAIL: slot oversold")
+        return 1
+    print("OK: capacity held")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:8547")
+    parser.add_argument("--restaurant", default="TheHungryUnicorn")
+    parser.add_argument("--days-ahead", type=int, default=5)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+    sys.exit(run(args.url, args.restaurant, args.days_ahead, args.requests, args.concurrency))